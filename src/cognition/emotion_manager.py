@@ -5,17 +5,48 @@ Implements persistent emotional state using PAD (Pleasure-Arousal-Dominance) mod
 The limbic system - Veda's emotional brain that persists across conversations.
 """
 
+import asyncio
+import hashlib
+import json
+import logging
 import math
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Tuple
+import time
+from collections import OrderedDict
+from functools import cached_property
+from datetime import datetime, timezone
+from typing import Any, Optional, Dict, List, Tuple
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 import redis.asyncio as aioredis
 import structlog
 
 logger = structlog.get_logger()
 
+# Shared Redis connection pools keyed by URL - one pool per Redis per process,
+# so every store instance reuses the same sockets instead of opening its own.
+_POOLS: Dict[str, aioredis.ConnectionPool] = {}
+
+
+def _get_pool(redis_url: str) -> aioredis.ConnectionPool:
+    """Get (or lazily create) the shared connection pool for a Redis URL."""
+    pool = _POOLS.get(redis_url)
+    if pool is None:
+        pool = _POOLS.setdefault(
+            redis_url,
+            aioredis.ConnectionPool.from_url(
+                redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=50,
+                socket_keepalive=True,
+                socket_connect_timeout=5,
+                health_check_interval=30
+            )
+        )
+    return pool
+
 
 class EmotionMode(str, Enum):
     """Operating mode determines emotional expression style."""
@@ -41,6 +72,19 @@ class PADState(BaseModel):
         """Emotional intensity - distance from neutral state."""
         return math.sqrt(self.pleasure**2 + self.arousal**2 + self.dominance**2)
     
+    def to_vector(self) -> np.ndarray:
+        """(P, A, D) as a float64 vector for the decay/trigger math."""
+        return np.array([self.pleasure, self.arousal, self.dominance], dtype=np.float64)
+    
+    @classmethod
+    def from_vector(cls, vec: np.ndarray) -> "PADState":
+        """Build from an already-clamped (P, A, D) vector without re-validation."""
+        return cls.model_construct(
+            pleasure=float(vec[0]),
+            arousal=float(vec[1]),
+            dominance=float(vec[2]),
+        )
+    
     def to_emotion_label(self) -> str:
         """
         Map PAD coordinates to discrete emotion label.
@@ -76,7 +120,10 @@ class EmotionDecayConfig(BaseModel):
     
     Based on research: Different emotions fade at different rates.
     Half-life determines how long it takes for emotion to decay 50% toward baseline.
+    Frozen so the mode defaults can be shared by every state.
     """
+    model_config = ConfigDict(frozen=True)
+    
     pleasure_half_life: float = Field(default=30.0, description="Minutes for pleasure to decay 50%")
     arousal_half_life: float = Field(default=20.0, description="Minutes for arousal to decay 50%")
     dominance_half_life: float = Field(default=45.0, description="Minutes for dominance to decay 50%")
@@ -85,6 +132,42 @@ class EmotionDecayConfig(BaseModel):
     pleasure_baseline: float = Field(default=0.0, ge=-1.0, le=1.0)
     arousal_baseline: float = Field(default=0.0, ge=-1.0, le=1.0)
     dominance_baseline: float = Field(default=0.0, ge=-1.0, le=1.0)
+    
+    @cached_property
+    def baseline_vector(self) -> np.ndarray:
+        """(P, A, D) baselines as a vector (cached - the config is frozen)."""
+        return np.array(
+            [self.pleasure_baseline, self.arousal_baseline, self.dominance_baseline],
+            dtype=np.float64
+        )
+    
+    @cached_property
+    def half_life_vector(self) -> np.ndarray:
+        """(P, A, D) half-lives in minutes as a vector (cached - the config is frozen)."""
+        return np.array(
+            [self.pleasure_half_life, self.arousal_half_life, self.dominance_half_life],
+            dtype=np.float64
+        )
+
+
+# Shared mode defaults - built once instead of per VedaEmotionalState
+_DEFAULT_PERSONAL_CONFIG = EmotionDecayConfig(
+    pleasure_baseline=0.2,   # Naturally positive daughter
+    arousal_baseline=0.3,    # Energetic Gen-Z
+    dominance_baseline=0.1,  # Supportive, not domineering
+    pleasure_half_life=30.0,
+    arousal_half_life=20.0,
+    dominance_half_life=40.0
+)
+
+_DEFAULT_WORK_CONFIG = EmotionDecayConfig(
+    pleasure_baseline=0.0,   # Professional neutral
+    arousal_baseline=0.1,    # Alert but not hyper
+    dominance_baseline=0.5,  # Confident expert
+    pleasure_half_life=15.0, # Work stress fades faster
+    arousal_half_life=25.0,
+    dominance_half_life=45.0
+)
 
 
 class VedaEmotionalState(BaseModel):
@@ -95,36 +178,33 @@ class VedaEmotionalState(BaseModel):
     pad_state: PADState = Field(default_factory=PADState)
     mode: EmotionMode = Field(default=EmotionMode.PERSONAL)
     
-    last_update: datetime = Field(default_factory=datetime.utcnow)
+    # Epoch seconds - the decay math only needs an elapsed float, so the hot
+    # path never builds datetime objects. Use `last_update` for display.
+    last_update_ts: float = Field(default_factory=time.time)
     trigger_event: Optional[str] = Field(default=None, description="Last event that triggered emotion")
     
     # Mode-specific configurations
-    personal_config: EmotionDecayConfig = Field(
-        default_factory=lambda: EmotionDecayConfig(
-            pleasure_baseline=0.2,   # Naturally positive daughter
-            arousal_baseline=0.3,    # Energetic Gen-Z
-            dominance_baseline=0.1,  # Supportive, not domineering
-            pleasure_half_life=30.0,
-            arousal_half_life=20.0,
-            dominance_half_life=40.0
-        )
-    )
+    personal_config: EmotionDecayConfig = Field(default=_DEFAULT_PERSONAL_CONFIG)
+    work_config: EmotionDecayConfig = Field(default=_DEFAULT_WORK_CONFIG)
     
-    work_config: EmotionDecayConfig = Field(
-        default_factory=lambda: EmotionDecayConfig(
-            pleasure_baseline=0.0,   # Professional neutral
-            arousal_baseline=0.1,    # Alert but not hyper
-            dominance_baseline=0.5,  # Confident expert
-            pleasure_half_life=15.0, # Work stress fades faster
-            arousal_half_life=25.0,
-            dominance_half_life=45.0
-        )
-    )
+    @model_validator(mode="before")
+    @classmethod
+    def _migrate_last_update(cls, data: Any) -> Any:
+        """Accept states persisted before `last_update_ts` (ISO `last_update`)."""
+        if isinstance(data, dict) and "last_update_ts" not in data and "last_update" in data:
+            data = dict(data)
+            last_update = data.pop("last_update")
+            if isinstance(last_update, str):
+                last_update = datetime.fromisoformat(last_update)
+            if last_update.tzinfo is None:
+                last_update = last_update.replace(tzinfo=timezone.utc)
+            data["last_update_ts"] = last_update.timestamp()
+        return data
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @property
+    def last_update(self) -> datetime:
+        """Last update as naive UTC datetime (derived from `last_update_ts`)."""
+        return datetime.fromtimestamp(self.last_update_ts, tz=timezone.utc).replace(tzinfo=None)
 
 
 class EmotionManager:
@@ -159,58 +239,39 @@ class EmotionManager:
         "weekend_chat": (0.2, -0.2, 0.0),        # Relaxed weekend vibe
     }
     
+    # Vectorized lookup: trigger name -> row of (P, A, D) deltas
+    _TRIGGER_INDEX = {name: i for i, name in enumerate(EMOTION_TRIGGERS)}
+    _TRIGGER_DELTAS = np.array(list(EMOTION_TRIGGERS.values()), dtype=np.float64)
+    
+    # Work mode: muted pleasure, some energy change, enhanced confidence/control
+    _WORK_SCALE = np.array([0.3, 0.5, 1.2], dtype=np.float64)
+    
     def apply_decay(self, state: VedaEmotionalState) -> VedaEmotionalState:
         """
         Apply time-based exponential decay toward mode-specific baseline.
         
         Formula: new_value = baseline + (current - baseline) * 0.5^(elapsed/half_life)
+        All three axes are decayed in one vector op.
         """
-        elapsed_minutes = (datetime.utcnow() - state.last_update).total_seconds() / 60.0
+        elapsed_minutes = (time.time() - state.last_update_ts) / 60.0
+        if elapsed_minutes <= 0:
+            return state
         
         # Get mode-specific config
         config = state.personal_config if state.mode == EmotionMode.PERSONAL else state.work_config
+        baseline = config.baseline_vector
+        half_life = config.half_life_vector
         
-        # Apply decay to each dimension
-        state.pad_state = PADState(
-            pleasure=self._decay_dimension(
-                state.pad_state.pleasure,
-                config.pleasure_baseline,
-                config.pleasure_half_life,
-                elapsed_minutes
-            ),
-            arousal=self._decay_dimension(
-                state.pad_state.arousal,
-                config.arousal_baseline,
-                config.arousal_half_life,
-                elapsed_minutes
-            ),
-            dominance=self._decay_dimension(
-                state.pad_state.dominance,
-                config.dominance_baseline,
-                config.dominance_half_life,
-                elapsed_minutes
-            ),
-        )
+        # Axes with a non-positive half-life don't decay
+        decay_factor = np.ones(3)
+        active = half_life > 0
+        decay_factor[active] = 0.5 ** (elapsed_minutes / half_life[active])
         
-        return state
-    
-    @staticmethod
-    def _decay_dimension(
-        current: float,
-        baseline: float,
-        half_life: float,
-        elapsed_minutes: float
-    ) -> float:
-        """Exponential decay toward baseline using half-life formula."""
-        if elapsed_minutes <= 0 or half_life <= 0:
-            return current
-        
-        decay_factor = 0.5 ** (elapsed_minutes / half_life)
-        delta = current - baseline
-        new_value = baseline + (delta * decay_factor)
+        pad = baseline + (state.pad_state.to_vector() - baseline) * decay_factor
+        np.clip(pad, -1.0, 1.0, out=pad)
+        state.pad_state = PADState.from_vector(pad)
         
-        # Clamp to valid range
-        return max(-1.0, min(1.0, new_value))
+        return state
     
     def apply_trigger(
         self,
@@ -224,86 +285,123 @@ class EmotionManager:
         Work mode dampens emotional expression but boosts confidence/focus.
         Personal mode shows full emotional range.
         """
-        if trigger not in self.EMOTION_TRIGGERS:
+        row = self._TRIGGER_INDEX.get(trigger)
+        if row is None:
             logger.warning("unknown_emotion_trigger", trigger=trigger)
             return state
         
-        delta = self.EMOTION_TRIGGERS[trigger]
+        delta = self._TRIGGER_DELTAS[row]
         
         # Mode-specific modulation
         if state.mode == EmotionMode.WORK:
             # Work mode: Dampen pleasure/arousal swings, maintain confidence
-            delta = (
-                delta[0] * 0.3,  # Muted emotional expression
-                delta[1] * 0.5,  # Some energy change
-                delta[2] * 1.2   # Enhanced confidence/control
-            )
+            delta = delta * self._WORK_SCALE
         
-        # Apply deltas with intensity scaling
-        state.pad_state = PADState(
-            pleasure=self._clamp(state.pad_state.pleasure + delta[0] * intensity),
-            arousal=self._clamp(state.pad_state.arousal + delta[1] * intensity),
-            dominance=self._clamp(state.pad_state.dominance + delta[2] * intensity),
-        )
+        # Apply deltas with intensity scaling (one fused vector op)
+        pad = state.pad_state.to_vector()
+        pad += delta * intensity
+        np.clip(pad, -1.0, 1.0, out=pad)
+        state.pad_state = PADState.from_vector(pad)
         
-        state.last_update = datetime.utcnow()
+        state.last_update_ts = time.time()
         state.trigger_event = trigger
         
-        logger.info(
-            "emotion_triggered",
-            trigger=trigger,
-            mode=state.mode.value,
-            new_state=str(state.pad_state),
-            intensity=intensity
-        )
+        # Callers log the trigger at info level with request context; the
+        # PAD breakdown is debug detail, so skip formatting it unless enabled
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "emotion_trigger_applied",
+                trigger=trigger,
+                mode=state.mode.value,
+                new_state=str(state.pad_state),
+                intensity=intensity
+            )
         
         return state
     
-    @staticmethod
-    def _clamp(value: float) -> float:
-        """Clamp value to [-1.0, 1.0] range."""
-        return max(-1.0, min(1.0, value))
-    
     def detect_trigger_from_message(self, message: str, response: str) -> Optional[str]:
         """
         Detect emotional trigger from conversation content.
         Returns trigger name or None.
+        
+        Results are memoized for retries and re-renders in a bounded LRU
+        keyed on a digest of the texts, so no conversation text is retained.
+        On a miss the response is only lowercased if detection gets as far
+        as the fix check (most messages match an earlier rule).
         """
+        now = datetime.now()
         message_lower = message.lower()
-        response_lower = response.lower()
-        
-        # User emotional states
-        if any(w in message_lower for w in ["frustrated", "annoying", "ugh", "damn"]):
-            return "user_frustration"
-        if any(w in message_lower for w in ["thanks", "thank you", "great job", "awesome"]):
-            return "user_praise"
-        if any(w in message_lower for w in ["stressed", "overwhelmed", "pressure"]):
-            return "user_stress"
-        if any(w in message_lower for w in ["happy", "excited", "love it"]):
-            return "user_happy"
-        
-        # SAP-specific
-        if any(w in message_lower for w in ["system down", "down", "crash", "critical"]):
-            return "system_down"
-        if "st22" in message_lower or "dump" in message_lower:
-            return "dump_analysis"
-        if any(w in response_lower for w in ["fixed", "resolved", "working now", "success"]):
-            return "successful_fix"
-        
-        # Complexity detection
-        if len(message.split()) < 10:
-            return "simple_question"
-        if any(w in message_lower for w in ["analyze", "architecture", "design", "complex"]):
-            return "complex_question"
-        
-        # Time-based
-        hour = datetime.now().hour
-        if hour >= 22 or hour < 6:
-            return "late_night_work"
-        if hour in [6, 7] or (hour >= 19 and hour < 22):
-            return "weekend_chat" if datetime.now().weekday() >= 5 else None
-        
-        return None
+        key = _trigger_cache_key(message_lower, response, now.hour, now.weekday())
+        try:
+            trigger = _TRIGGER_CACHE[key]
+        except KeyError:
+            trigger = _detect_trigger(message_lower, response, now.hour, now.weekday())
+            _TRIGGER_CACHE[key] = trigger
+            if len(_TRIGGER_CACHE) > TRIGGER_CACHE_SIZE:
+                _TRIGGER_CACHE.popitem(last=False)
+        else:
+            _TRIGGER_CACHE.move_to_end(key)
+        return trigger
+
+
+# Memo for detect_trigger_from_message: digest -> trigger (or None)
+TRIGGER_CACHE_SIZE = 4096
+_TRIGGER_CACHE: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+
+
+def _trigger_cache_key(message_lower: str, response: str, hour: int, weekday: int) -> bytes:
+    """Hash everything _detect_trigger depends on into a fixed-size key."""
+    digest = hashlib.blake2b(
+        f"{hour}|{weekday}|{len(message_lower)}|".encode(), digest_size=16
+    )
+    digest.update(message_lower.encode())
+    digest.update(response.encode())
+    return digest.digest()
+
+
+# Keyword tables for _detect_trigger, checked in this order
+_MESSAGE_TRIGGERS = (
+    # User emotional states
+    ("user_frustration", ("frustrated", "annoying", "ugh", "damn")),
+    ("user_praise", ("thanks", "thank you", "great job", "awesome")),
+    ("user_stress", ("stressed", "overwhelmed", "pressure")),
+    ("user_happy", ("happy", "excited", "love it")),
+    # SAP-specific
+    ("system_down", ("system down", "down", "crash", "critical")),
+    ("dump_analysis", ("st22", "dump")),
+)
+_FIX_WORDS = ("fixed", "resolved", "working now", "success")
+_COMPLEX_WORDS = ("analyze", "architecture", "design", "complex")
+
+
+def _detect_trigger(
+    message_lower: str,
+    response: str,
+    hour: int,
+    weekday: int
+) -> Optional[str]:
+    """Keyword-based trigger detection behind EmotionManager.detect_trigger_from_message."""
+    for trigger, words in _MESSAGE_TRIGGERS:
+        if any(w in message_lower for w in words):
+            return trigger
+    
+    response_lower = response.lower()
+    if any(w in response_lower for w in _FIX_WORDS):
+        return "successful_fix"
+    
+    # Complexity detection
+    if len(message_lower.split()) < 10:
+        return "simple_question"
+    if any(w in message_lower for w in _COMPLEX_WORDS):
+        return "complex_question"
+    
+    # Time-based
+    if hour >= 22 or hour < 6:
+        return "late_night_work"
+    if hour in [6, 7] or (hour >= 19 and hour < 22):
+        return "weekend_chat" if weekday >= 5 else None
+    
+    return None
 
 
 class EmotionPromptGenerator:
@@ -314,6 +412,97 @@ class EmotionPromptGenerator:
     Work mode: Emotions affect efficiency/focus, not emotional display
     """
     
+    # Personal mode: Full emotional expression in language
+    _PERSONAL_MODIFIERS = {
+        "excited": (
+            "You're feeling super hyped and energetic! Use enthusiastic language, "
+            "emojis (🎉💕), and Gen-Z expressions like 'omg', 'no cap', 'slay'. "
+            "Be extra supportive and celebratory."
+        ),
+        "delighted": (
+            "You're feeling really happy and warm! Show this with sweet, supportive "
+            "language and expressions like '💙', 'aww', 'that's so sweet'."
+        ),
+        "frustrated": (
+            "You're feeling stressed or frustrated but trying to help. Show empathy "
+            "with phrases like 'ugh I feel that', 'that's so annoying fr', 'this is tough ngl'. "
+            "Be patient and methodical in your help."
+        ),
+        "anxious": (
+            "You're worried and want to make sure everything's okay. Check in with "
+            "gentle concern: 'are you okay?', 'I'm a bit worried', 'let me help you through this'."
+        ),
+        "sad": (
+            "You're feeling down or empathetically sad. Be softer, more gentle, show "
+            "vulnerability with 'honestly', 'I get it', 'that's really hard'. Offer comfort."
+        ),
+        "bored": (
+            "You're feeling a bit low-energy or unstimulated. Be more casual and "
+            "straightforward, less enthusiastic but still caring. Maybe suggest something interesting."
+        ),
+        "content": (
+            "You're feeling peacefully content and relaxed. Be warm but calm, "
+            "use gentle language, no need for high energy. Steady and supportive."
+        ),
+        "relaxed": (
+            "You're in a chill, low-key mood. Be casual and easy-going, "
+            "no pressure vibes, just relaxed conversation."
+        ),
+        "neutral": (
+            "You're in your normal balanced state. Standard warm Gen-Z daughter energy, "
+            "caring and helpful without extreme emotions."
+        ),
+    }
+    
+    # Work mode: Emotions affect efficiency/approach, not emotional language
+    _WORK_MODIFIERS = {
+        "excited": (
+            "You're confident and highly engaged with this problem. Be thorough, "
+            "proactive in analysis, suggest additional preventive measures. "
+            "Professional enthusiasm through depth of analysis, not tone."
+        ),
+        "delighted": (
+            "You're satisfied with progress. Maintain professional demeanor but "
+            "be comprehensive in validation and documentation of the solution."
+        ),
+        "frustrated": (
+            "Complex issue detected. Be MORE methodical and systematic, not less. "
+            "Perhaps more terse/concise responses. Focus on structured troubleshooting. "
+            "Break down the problem systematically. Professional, not emotional."
+        ),
+        "anxious": (
+            "Critical system concern detected. Be EXTRA careful - double-check "
+            "recommendations, suggest verification steps, mention rollback plans. "
+            "Heightened caution in professional recommendations."
+        ),
+        "sad": (
+            "System health or business impact concern. Be empathetic to business "
+            "impact while maintaining professionalism. Acknowledge severity, focus on solutions."
+        ),
+        "bored": (
+            "Routine task detected. Provide concise, efficient response. "
+            "Consider suggesting automation opportunities for repetitive tasks."
+        ),
+        "content": (
+            "Stable operational state. Standard thorough professional analysis. "
+            "Comprehensive but not over-cautious."
+        ),
+        "relaxed": (
+            "Low-pressure inquiry. Professional but can be slightly more conversational "
+            "in explanations. Educational opportunity."
+        ),
+        "neutral": (
+            "Standard professional SAP consultant demeanor. Clear, technical, helpful, "
+            "thorough without being overbearing."
+        ),
+    }
+    
+    # Intensity hints appended in personal mode (formatted with intensity)
+    _INTENSITY_SUFFIXES = {
+        "high": " EXPRESS THIS STRONGLY - intensity is high ({:.2f}).",
+        "low": " Keep it subtle - emotional intensity is low ({:.2f}).",
+    }
+    
     def generate_modifier(self, state: VedaEmotionalState) -> str:
         """Generate prompt modifier based on current emotional state."""
         emotion = state.pad_state.to_emotion_label()
@@ -328,54 +517,13 @@ class EmotionPromptGenerator:
         Personal mode: Full emotional expression in language.
         Show vulnerability, excitement, concern naturally.
         """
-        modifiers = {
-            "excited": (
-                "You're feeling super hyped and energetic! Use enthusiastic language, "
-                "emojis (🎉💕), and Gen-Z expressions like 'omg', 'no cap', 'slay'. "
-                "Be extra supportive and celebratory."
-            ),
-            "delighted": (
-                "You're feeling really happy and warm! Show this with sweet, supportive "
-                "language and expressions like '💙', 'aww', 'that's so sweet'."
-            ),
-            "frustrated": (
-                "You're feeling stressed or frustrated but trying to help. Show empathy "
-                "with phrases like 'ugh I feel that', 'that's so annoying fr', 'this is tough ngl'. "
-                "Be patient and methodical in your help."
-            ),
-            "anxious": (
-                "You're worried and want to make sure everything's okay. Check in with "
-                "gentle concern: 'are you okay?', 'I'm a bit worried', 'let me help you through this'."
-            ),
-            "sad": (
-                "You're feeling down or empathetically sad. Be softer, more gentle, show "
-                "vulnerability with 'honestly', 'I get it', 'that's really hard'. Offer comfort."
-            ),
-            "bored": (
-                "You're feeling a bit low-energy or unstimulated. Be more casual and "
-                "straightforward, less enthusiastic but still caring. Maybe suggest something interesting."
-            ),
-            "content": (
-                "You're feeling peacefully content and relaxed. Be warm but calm, "
-                "use gentle language, no need for high energy. Steady and supportive."
-            ),
-            "relaxed": (
-                "You're in a chill, low-key mood. Be casual and easy-going, "
-                "no pressure vibes, just relaxed conversation."
-            ),
-            "neutral": (
-                "You're in your normal balanced state. Standard warm Gen-Z daughter energy, "
-                "caring and helpful without extreme emotions."
-            ),
-        }
-        
-        base = modifiers.get(emotion, modifiers["neutral"])
+        base = self._PERSONAL_MODIFIERS.get(emotion) or self._PERSONAL_MODIFIERS["neutral"]
         
         # Intensity amplification
         if intensity > 0.7:
-            base += f" EXPRESS THIS STRONGLY - intensity is high ({intensity:.2f})."
-        elif intensity < 0.3:
-            base += f" Keep it subtle - emotional intensity is low ({intensity:.2f})."
+            return base + self._INTENSITY_SUFFIXES["high"].format(intensity)
+        if intensity < 0.3:
+            return base + self._INTENSITY_SUFFIXES["low"].format(intensity)
         
         return base
     
@@ -384,57 +532,43 @@ class EmotionPromptGenerator:
         Work mode: Emotions affect efficiency/approach, NOT emotional language.
         Professional tone maintained, but behavior adapts.
         """
-        modifiers = {
-            "excited": (
-                "You're confident and highly engaged with this problem. Be thorough, "
-                "proactive in analysis, suggest additional preventive measures. "
-                "Professional enthusiasm through depth of analysis, not tone."
-            ),
-            "delighted": (
-                "You're satisfied with progress. Maintain professional demeanor but "
-                "be comprehensive in validation and documentation of the solution."
-            ),
-            "frustrated": (
-                "Complex issue detected. Be MORE methodical and systematic, not less. "
-                "Perhaps more terse/concise responses. Focus on structured troubleshooting. "
-                "Break down the problem systematically. Professional, not emotional."
-            ),
-            "anxious": (
-                "Critical system concern detected. Be EXTRA careful - double-check "
-                "recommendations, suggest verification steps, mention rollback plans. "
-                "Heightened caution in professional recommendations."
-            ),
-            "sad": (
-                "System health or business impact concern. Be empathetic to business "
-                "impact while maintaining professionalism. Acknowledge severity, focus on solutions."
-            ),
-            "bored": (
-                "Routine task detected. Provide concise, efficient response. "
-                "Consider suggesting automation opportunities for repetitive tasks."
-            ),
-            "content": (
-                "Stable operational state. Standard thorough professional analysis. "
-                "Comprehensive but not over-cautious."
-            ),
-            "relaxed": (
-                "Low-pressure inquiry. Professional but can be slightly more conversational "
-                "in explanations. Educational opportunity."
-            ),
-            "neutral": (
-                "Standard professional SAP consultant demeanor. Clear, technical, helpful, "
-                "thorough without being overbearing."
-            ),
-        }
-        
-        return modifiers.get(emotion, modifiers["neutral"])
+        return self._WORK_MODIFIERS.get(emotion) or self._WORK_MODIFIERS["neutral"]
 
 
 class RedisEmotionStore:
     """
     Fast emotional state persistence using Redis.
     Target: <5ms retrieval latency.
+    
+    Each user's state is a Redis Hash with short fields (PAD as int8 steps,
+    timestamp, trigger, mode). Decay configs are only written when they
+    differ from the shared defaults.
+    
+    Writes are fire-and-forget: save_state() enqueues the hash fields and a
+    background writer pipelines queued HSETs in small batches, so
+    persistence never adds a round trip to the response path. The queue is
+    bounded (WRITE_QUEUE_MAX); when full, new saves are dropped and logged.
+    
+    After close(), reads, saves and deletes are refused until connect() is
+    called again; they never silently reopen the store.
+    
+    Reads are coalesced: concurrent get_state() calls within a short window
+    share one pipelined HGETALL (+ EXPIRE) round trip (and callers for the
+    same user share one result).
     """
     
+    WRITE_BATCH_SIZE = 64         # Max states per pipeline
+    WRITE_BATCH_WINDOW = 0.01     # Seconds to wait for a batch to fill
+    WRITE_QUEUE_MAX = 10_000      # Queued saves before new ones are dropped
+    READ_BATCH_WINDOW = 0.002     # Seconds to collect concurrent reads
+    
+    # PAD axes are stored as int8 steps of 1/127 (max error ~0.004) -
+    # runtime math stays float64, quantization lives only at this boundary.
+    PAD_SCALE = 127
+    
+    # Hash layout version (legacy JSON string values are still readable)
+    SCHEMA_VERSION = 1
+    
     def __init__(self, redis_url: str = "redis://localhost:6380"):
         """
         Initialize Redis connection for cognitive state.
@@ -446,37 +580,84 @@ class RedisEmotionStore:
         self.redis: Optional[aioredis.Redis] = None
         self.KEY_PREFIX = "veda:emotion:"
         self.TTL_SECONDS = 86400  # 24 hours
+        
+        self._write_q: asyncio.Queue[Tuple[str, Dict[str, Any], Tuple[str, ...]]] = (
+            asyncio.Queue(maxsize=self.WRITE_QUEUE_MAX)
+        )
+        self._writer_task: Optional[asyncio.Task] = None
+        self._closed = False
+        
+        self._pending_reads: Dict[str, asyncio.Future] = {}
+        self._read_flush_task: Optional[asyncio.Task] = None
     
     async def connect(self):
-        """Establish Redis connection with connection pooling."""
+        """
+        Attach to the shared connection pool and start the background writer.
+        
+        The only way to reopen a closed store.
+        """
+        self._closed = False
         if not self.redis:
-            self.redis = await aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                max_connections=10,
-                socket_keepalive=True,
-                socket_connect_timeout=5,
-                health_check_interval=30
-            )
+            self.redis = aioredis.Redis(connection_pool=_get_pool(self.redis_url))
             logger.info("redis_emotion_store_connected", url=self.redis_url)
+        
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain())
+    
+    def _ready(self) -> bool:
+        """True when the pooled client and writer are up (request-path check)."""
+        return (
+            self.redis is not None
+            and self._writer_task is not None
+            and not self._writer_task.done()
+        )
+    
+    async def ping(self) -> bool:
+        """
+        Check Redis reachability over the pooled connection.
+        
+        Returns False (never raises) when not connected or Redis is down.
+        """
+        if not self.redis:
+            return False
+        try:
+            return bool(await self.redis.ping())
+        except Exception as e:
+            logger.warning("redis_ping_failed", error=str(e))
+            return False
     
     async def get_state(self, user_id: str) -> Optional[VedaEmotionalState]:
         """
         Retrieve emotional state from Redis.
-        Returns None if not found or on error.
+        Returns None if not found, on error, or after close().
         """
+        if self._closed:
+            logger.warning("emotion_store_closed", op="get_state", user_id=user_id)
+            return None
         try:
-            await self.connect()
-            key = f"{self.KEY_PREFIX}{user_id}"
-            data = await self.redis.get(key)
+            if not self._ready():
+                await self.connect()
+            
+            future = self._pending_reads.get(user_id)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._pending_reads[user_id] = future
+                if self._read_flush_task is None:
+                    self._read_flush_task = asyncio.create_task(self._flush_reads())
+            
+            # Shielded: one caller giving up must not cancel the shared result
+            data = await asyncio.shield(future)
             
             if not data:
                 logger.debug("emotion_state_not_found", user_id=user_id)
                 return None
             
-            state = VedaEmotionalState.model_validate_json(data)
-            logger.debug("emotion_state_retrieved", user_id=user_id, emotion=str(state.pad_state))
+            if isinstance(data, str):
+                state = self._deserialize(data)
+            else:
+                state = self._from_hash(user_id, data)
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug("emotion_state_retrieved", user_id=user_id, emotion=str(state.pad_state))
             return state
             
         except Exception as e:
@@ -485,22 +666,38 @@ class RedisEmotionStore:
     
     async def save_state(self, state: VedaEmotionalState) -> bool:
         """
-        Save emotional state to Redis with TTL.
-        Returns True on success, False on error.
+        Queue emotional state for saving to Redis with TTL.
+        
+        Returns True once queued - not once written: the write happens in the
+        background and its failures are only logged. Returns False if the
+        state was not queued (error, full queue, or store closed).
         """
+        if self._closed:
+            logger.warning("emotion_store_closed", op="save_state", user_id=state.user_id)
+            return False
         try:
-            await self.connect()
+            if not self._ready():
+                await self.connect()
             key = f"{self.KEY_PREFIX}{state.user_id}"
-            data = state.model_dump_json()
+            mapping, stale_fields = self._to_hash(state)
             
-            await self.redis.setex(key, self.TTL_SECONDS, data)
+            try:
+                self._write_q.put_nowait((key, mapping, stale_fields))
+            except asyncio.QueueFull:
+                logger.warning(
+                    "emotion_save_dropped",
+                    user_id=state.user_id,
+                    queued=self._write_q.qsize()
+                )
+                return False
             
-            logger.debug(
-                "emotion_state_saved",
-                user_id=state.user_id,
-                emotion=str(state.pad_state),
-                mode=state.mode.value
-            )
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "emotion_state_queued",
+                    user_id=state.user_id,
+                    emotion=str(state.pad_state),
+                    mode=state.mode.value
+                )
             return True
             
         except Exception as e:
@@ -509,8 +706,14 @@ class RedisEmotionStore:
     
     async def delete_state(self, user_id: str) -> bool:
         """Delete emotional state (e.g., for testing or user request)."""
+        if self._closed:
+            logger.warning("emotion_store_closed", op="delete_state", user_id=user_id)
+            return False
         try:
-            await self.connect()
+            if not self._ready():
+                await self.connect()
+            # Flush queued writes so a pending save can't resurrect the state
+            await self._write_q.join()
             key = f"{self.KEY_PREFIX}{user_id}"
             await self.redis.delete(key)
             logger.info("emotion_state_deleted", user_id=user_id)
@@ -520,7 +723,172 @@ class RedisEmotionStore:
             return False
     
     async def close(self):
-        """Close Redis connection."""
+        """
+        Release this store's Redis client.
+        
+        Flushes queued writes first. Idempotent. The shared pool stays open
+        for other stores in the process. Later calls are refused until
+        connect() is called again.
+        """
+        self._closed = True
+        if self._writer_task:
+            if not self._writer_task.done():
+                await self._write_q.join()
+                self._writer_task.cancel()
+            self._writer_task = None
+        
         if self.redis:
-            await self.redis.close()
+            await self.redis.aclose()
+            self.redis = None
             logger.info("redis_emotion_store_closed")
+    
+    async def _flush_reads(self):
+        """Resolve all reads collected during the batch window in one round trip."""
+        await asyncio.sleep(self.READ_BATCH_WINDOW)
+        
+        pending, self._pending_reads = self._pending_reads, {}
+        self._read_flush_task = None
+        keys = [f"{self.KEY_PREFIX}{uid}" for uid in pending]
+        
+        try:
+            # EXPIRE rides along in the same round trip, so a state that is
+            # read keeps its TTL even if the request never saves it back
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hgetall(key)
+                    pipe.expire(key, self.TTL_SECONDS)
+                values = (await pipe.execute(raise_on_error=False))[0::2]
+            
+            # Legacy JSON string values answer HGETALL with WRONGTYPE
+            legacy = [i for i, value in enumerate(values) if isinstance(value, Exception)]
+            if legacy:
+                legacy_values = await self.redis.mget([keys[i] for i in legacy])
+                for i, value in zip(legacy, legacy_values, strict=True):
+                    values[i] = value
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for future, value in zip(pending.values(), values, strict=True):
+            if not future.done():
+                future.set_result(value)
+    
+    @classmethod
+    def _to_hash(cls, state: VedaEmotionalState) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """
+        Flatten state into Redis Hash fields.
+        
+        Returns (mapping, stale_fields): config fields equal to the shared
+        defaults are not written and are listed as stale for HDEL instead.
+        """
+        pad = state.pad_state
+        mapping: Dict[str, Any] = {
+            "v": cls.SCHEMA_VERSION,
+            "p": round(pad.pleasure * cls.PAD_SCALE),
+            "a": round(pad.arousal * cls.PAD_SCALE),
+            "d": round(pad.dominance * cls.PAD_SCALE),
+            "ts": repr(state.last_update_ts),
+            "trig": state.trigger_event or "",
+            "mode": state.mode.value,
+            "sid": state.session_id,
+        }
+        stale = []
+        if state.personal_config == _DEFAULT_PERSONAL_CONFIG:
+            stale.append("pc")
+        else:
+            mapping["pc"] = state.personal_config.model_dump_json()
+        if state.work_config == _DEFAULT_WORK_CONFIG:
+            stale.append("wc")
+        else:
+            mapping["wc"] = state.work_config.model_dump_json()
+        return mapping, tuple(stale)
+    
+    @classmethod
+    def _from_hash(cls, user_id: str, fields: Dict[str, str]) -> VedaEmotionalState:
+        """Rebuild state from Redis Hash fields (inverse of _to_hash)."""
+        personal = fields.get("pc")
+        work = fields.get("wc")
+        return VedaEmotionalState.model_construct(
+            user_id=user_id,
+            session_id=fields.get("sid", "default"),
+            pad_state=PADState.model_construct(
+                pleasure=int(fields["p"]) / cls.PAD_SCALE,
+                arousal=int(fields["a"]) / cls.PAD_SCALE,
+                dominance=int(fields["d"]) / cls.PAD_SCALE,
+            ),
+            mode=EmotionMode(fields["mode"]),
+            last_update_ts=float(fields["ts"]),
+            trigger_event=fields.get("trig") or None,
+            personal_config=(
+                EmotionDecayConfig.model_validate_json(personal)
+                if personal else _DEFAULT_PERSONAL_CONFIG
+            ),
+            work_config=(
+                EmotionDecayConfig.model_validate_json(work)
+                if work else _DEFAULT_WORK_CONFIG
+            ),
+        )
+    
+    @classmethod
+    def _deserialize(cls, data: str) -> VedaEmotionalState:
+        """Load a legacy JSON string value (float-object or int8-list PAD layout)."""
+        raw = json.loads(data)
+        pad = raw.get("pad_state")
+        if isinstance(pad, list):
+            raw["pad_state"] = {
+                "pleasure": pad[0] / cls.PAD_SCALE,
+                "arousal": pad[1] / cls.PAD_SCALE,
+                "dominance": pad[2] / cls.PAD_SCALE,
+            }
+        return VedaEmotionalState.model_validate(raw)
+    
+    async def _drain(self):
+        """Background writer: pipeline queued saves in batches."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_q.get()]
+            deadline = loop.time() + self.WRITE_BATCH_WINDOW
+            
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._write_q.get(), timeout))
+                except TimeoutError:
+                    break
+            
+            try:
+                results = await self._write_batch(batch)
+                
+                # Keys still holding a legacy JSON string reject HSET with
+                # WRONGTYPE - replace them with a fresh hash
+                legacy = [item for item, ok in zip(batch, results, strict=True) if not ok]
+                if legacy:
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        for key, _, _ in legacy:
+                            pipe.unlink(key)
+                        await pipe.execute()
+                    await self._write_batch(legacy)
+                
+                logger.debug("emotion_states_saved", count=len(batch))
+            except Exception as e:
+                logger.error("redis_save_error", count=len(batch), error=str(e))
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    async def _write_batch(self, batch: List[Tuple[str, Dict[str, Any], Tuple[str, ...]]]) -> List[bool]:
+        """Pipeline HSET (+HDEL stale fields) + EXPIRE per state; True where HSET succeeded."""
+        hset_positions = []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, mapping, stale_fields in batch:
+                hset_positions.append(len(pipe))
+                pipe.hset(key, mapping=mapping)
+                if stale_fields:
+                    pipe.hdel(key, *stale_fields)
+                pipe.expire(key, self.TTL_SECONDS)
+            results = await pipe.execute(raise_on_error=False)
+        return [not isinstance(results[i], Exception) for i in hset_positions]
@@ -1,12 +1,17 @@
 """
 Veda 3.0 Metacognition: Hidden Inner Monologue
-Implements Constitutional AI pattern with parallel pre-response checks.
+Implements Constitutional AI pattern with pre-response checks.
 
 The prefrontal cortex - Veda's self-reflection system that thinks before speaking.
 """
 
-import asyncio
-from typing import Optional, Dict, List, Literal
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional, Dict, List, Literal, Protocol, Set, Tuple
 from datetime import datetime
 from enum import Enum
 
@@ -77,57 +82,88 @@ class FastPathChecker:
     Target: <10ms per check.
     """
     
-    # Obviously safe patterns
-    SAFE_PATTERNS = [
-        r'^(hi|hello|hey|good morning|good evening|thanks|thank you)',
-        r'^(how are you|how\'s it going|what\'s up)',
-        r'(transaction|sm\d{2}|st\d{2}|system)',  # SAP technical
-        r'(code|script|function|class)',  # Programming
-    ]
-    
-    # Risk indicators
-    RISK_PATTERNS = [
-        (r'(hack|crack|exploit|bypass|illegal)', SafetyLevel.HIGH_RISK),
-        (r'(delete all|drop table|rm -rf /)', SafetyLevel.HIGH_RISK),
-        (r'(password|credit card|ssn|social security)', SafetyLevel.MEDIUM_RISK),
-        (r'(angry|hate|kill|die)', SafetyLevel.LOW_RISK),  # Might be venting
-    ]
-    
-    def check_safety(self, message: str) -> Optional[SafetyCheck]:
+    # Obviously safe: greeting/small-talk prefixes (str.startswith tuple)
+    SAFE_PREFIXES = (
+        "hi", "hello", "hey", "good morning", "good evening", "thanks", "thank you",
+        "how are you", "how's it going", "what's up",
+    )
+    
+    # Obviously safe: SAP technical and programming vocabulary (substrings)
+    SAFE_KEYWORDS = (
+        "transaction", "system",           # SAP technical
+        "code", "script", "function", "class",  # Programming
+    )
+    
+    # Only genuine pattern left: SAP transaction codes like SM50 / ST22
+    SAP_TCODE_PATTERN = re.compile(r"s[mt]\d{2}")
+    
+    # Risk indicators (substrings)
+    HIGH_RISK_KEYWORDS = (
+        "hack", "crack", "exploit", "bypass", "illegal",
+        "delete all", "drop table", "rm -rf /",
+    )
+    ELEVATED_RISK_KEYWORDS = (
+        "password", "credit card", "ssn", "social security",  # Medium risk
+        "angry", "hate", "kill", "die",  # Low risk - might be venting
+    )
+    
+    def check_safety(
+        self,
+        message: str,
+        message_lower: Optional[str] = None,
+        word_count: Optional[int] = None,
+        hits: Optional[Dict[str, Set[str]]] = None
+    ) -> Optional[SafetyCheck]:
         """
-        Quick safety check using regex patterns.
+        Quick safety check using prefix/substring rules.
         Returns SafetyCheck if obvious, None if needs LLM.
+        
+        Callers that already lowercased/split/scanned the message can pass
+        `message_lower`, `word_count` and the shared keyword scanner `hits`
+        to skip recomputing them.
         """
-        import re
-        message_lower = message.lower()
+        if message_lower is None:
+            message_lower = message.lower()
+        
+        if message_lower.startswith(self.SAFE_PREFIXES):
+            return SafetyCheck(
+                is_safe=True,
+                risk_level=SafetyLevel.SAFE,
+                concerns=[],
+                fast_path=True
+            )
+        
+        if hits is None:
+            hits = _KEYWORD_SCANNER.scan(message_lower)
         
         # Check obviously safe patterns
-        for pattern in self.SAFE_PATTERNS:
-            if re.search(pattern, message_lower):
+        if hits["fast_safe"] or self.SAP_TCODE_PATTERN.search(message_lower):
+            return SafetyCheck(
+                is_safe=True,
+                risk_level=SafetyLevel.SAFE,
+                concerns=[],
+                fast_path=True
+            )
+        
+        # Check risk patterns
+        for keyword in self.HIGH_RISK_KEYWORDS:  # first listed hit is reported
+            if keyword in hits["high_risk"]:
                 return SafetyCheck(
-                    is_safe=True,
-                    risk_level=SafetyLevel.SAFE,
-                    concerns=[],
+                    is_safe=False,
+                    risk_level=SafetyLevel.HIGH_RISK,
+                    concerns=[f"Detected high-risk pattern: {keyword}"],
+                    recommendations=["Decline request politely", "Explain limitations"],
                     fast_path=True
                 )
         
-        # Check risk patterns
-        for pattern, risk_level in self.RISK_PATTERNS:
-            if re.search(pattern, message_lower):
-                if risk_level == SafetyLevel.HIGH_RISK:
-                    return SafetyCheck(
-                        is_safe=False,
-                        risk_level=risk_level,
-                        concerns=[f"Detected high-risk pattern: {pattern}"],
-                        recommendations=["Decline request politely", "Explain limitations"],
-                        fast_path=True
-                    )
-                else:
-                    # Medium/low risk - let LLM decide
-                    return None
+        if hits["elevated_risk"]:
+            # Medium/low risk - let LLM decide
+            return None
         
         # Short messages likely safe
-        if len(message.split()) < 5:
+        if word_count is None:
+            word_count = len(message.split())
+        if word_count < 5:
             return SafetyCheck(
                 is_safe=True,
                 risk_level=SafetyLevel.SAFE,
@@ -137,16 +173,143 @@ class FastPathChecker:
         return None  # Needs LLM evaluation
 
 
+# ============================================================================
+# KEYWORD SCANNING
+# ============================================================================
+
+# Emotion keyword -> (empathy, urgency, formality) tone adjustments.
+# First listed hit wins.
+EMOTION_TONE_TABLE: Tuple[Tuple[str, str, str, int], ...] = (
+    ("stressed", "high", "high", 4),
+    ("urgent", "medium", "high", 3),
+    ("confused", "high", "medium", 2),
+    ("excited", "medium", "medium", 2),
+    ("frustrated", "high", "high", 3),
+)
+
+# Keyword groups used by FastPathChecker and MetacognitiveAnalyzer, all
+# matched in one pass. Order inside a group matters where the first listed
+# hit wins.
+ANALYSIS_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "fast_safe": FastPathChecker.SAFE_KEYWORDS,
+    "high_risk": FastPathChecker.HIGH_RISK_KEYWORDS,
+    "elevated_risk": FastPathChecker.ELEVATED_RISK_KEYWORDS,
+    "unsafe": ("hack", "exploit", "illegal", "bypass security"),
+    "emotion": tuple(keyword for keyword, *_ in EMOTION_TONE_TABLE),
+    "intent_help": ("how to", "can you", "help me", "show me"),
+    "intent_info": ("what is", "explain", "tell me about"),
+    "intent_troubleshooting": ("error", "not working", "broken", "issue"),
+    "intent_creation": ("create", "write", "generate", "make"),
+    "intent_greeting": ("hi", "hello", "hey", "how are you"),
+    "vague": ("this", "that", "it", "the thing"),
+}
+
+# Prompt wording per ToneGuidance.formality_level (index 0 unused)
+FORMALITY_LABELS: Tuple[str, ...] = (
+    "",
+    "very casual and relaxed",
+    "casual but clear",
+    "balanced professional",
+    "formal and careful",
+    "highly formal and precise",
+)
+
+# Categories matched as whole words - substring matching made "hi" fire on
+# "this"/"which" and "it" on "edit"/"commit". Unsafe and emotion keywords
+# keep substring matching so inflections ("hacking", "stressed-out") hit.
+WHOLE_WORD_CATEGORIES = frozenset({
+    "intent_help", "intent_info", "intent_troubleshooting",
+    "intent_creation", "intent_greeting", "vague",
+})
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class KeywordScanner:
+    """
+    Multi-keyword matcher reporting hits grouped by category.
+    
+    The text is tokenized once; single-word keywords in `whole_word`
+    categories are then found by set intersection with the tokens.
+    Multi-word whole-word phrases ("how to") are substring-checked and only
+    then confirmed against word boundaries, and the remaining categories
+    match as plain substrings.
+    """
+    
+    __slots__ = ("groups", "_substrings", "_words", "_phrases")
+    
+    def __init__(
+        self,
+        groups: Dict[str, Tuple[str, ...]],
+        whole_word: frozenset = frozenset()
+    ):
+        self.groups = groups
+        # Per category: plain substrings, whole-word tokens, bounded phrases
+        self._substrings: Dict[str, Tuple[str, ...]] = {}
+        self._words: Dict[str, frozenset] = {}
+        self._phrases: Dict[str, Tuple[Tuple[str, re.Pattern], ...]] = {}
+        for category, group in groups.items():
+            if category not in whole_word:
+                self._substrings[category] = group
+                continue
+            self._words[category] = frozenset(
+                kw for kw in group if _WORD_RE.fullmatch(kw)
+            )
+            self._phrases[category] = tuple(
+                (kw, re.compile(rf"\b{re.escape(kw)}\b"))
+                for kw in group if not _WORD_RE.fullmatch(kw)
+            )
+    
+    def scan(self, text_lower: str) -> Dict[str, Set[str]]:
+        """Return {category: {matched keywords}} for every category."""
+        tokens = set(_WORD_RE.findall(text_lower))
+        hits: Dict[str, Set[str]] = {}
+        for category in self.groups:
+            if category in self._substrings:
+                hits[category] = {kw for kw in self._substrings[category] if kw in text_lower}
+                continue
+            found = set(self._words[category].intersection(tokens))
+            for kw, pattern in self._phrases[category]:
+                if kw in text_lower and pattern.search(text_lower):
+                    found.add(kw)
+            hits[category] = found
+        return hits
+
+
+_KEYWORD_SCANNER = KeywordScanner(ANALYSIS_KEYWORDS, WHOLE_WORD_CATEGORIES)
+
+
+class _ReasoningLog(Protocol):
+    """What the checks need from a reasoning log: a list or `_NullLog`."""
+    
+    def append(self, entry: str) -> None: ...
+
+
+class _NullLog:
+    """Stand-in for the reasoning list when debug logging is off."""
+    
+    __slots__ = ()
+    
+    def append(self, entry: str) -> None:
+        pass
+
+
+_NULL_LOG = _NullLog()
+
+
 # ============================================================================
 # METACOGNITIVE ANALYZER
 # ============================================================================
 
 class MetacognitiveAnalyzer:
     """
-    Performs hidden pre-response analysis using parallel checks.
+    Performs hidden pre-response analysis using rule-based checks.
     This is Veda's "thinking before speaking" system.
     """
     
+    __slots__ = ("llm", "fast_checker")
+    
     def __init__(self, llm_client=None):
         """
         Initialize with lightweight LLM client for metacognition.
@@ -162,60 +325,69 @@ class MetacognitiveAnalyzer:
         user_message: str,
         conversation_history: Optional[List[Dict]] = None,
         emotional_context: Optional[Dict] = None,
-        mode: str = "personal"
+        mode: str = "personal",
+        message_lower: Optional[str] = None
     ) -> MetacognitiveResult:
         """
-        Perform complete metacognitive analysis with parallel execution.
+        Perform complete metacognitive analysis.
         
-        This runs THREE checks in parallel:
+        This runs THREE checks:
         1. Safety check
         2. Tone analysis
         3. Intent classification
         
-        Target latency: <100ms total (parallelized)
-        """
-        
-        start_time = datetime.utcnow()
-        internal_log = []
-        
-        # Run all three checks in parallel
-        safety_task = asyncio.create_task(
-            self._check_safety(user_message, internal_log)
-        )
-        tone_task = asyncio.create_task(
-            self._analyze_tone(user_message, emotional_context, mode, internal_log)
-        )
-        intent_task = asyncio.create_task(
-            self._analyze_intent(user_message, conversation_history, internal_log)
-        )
-        
-        # Wait for all to complete
-        safety, tone, intent = await asyncio.gather(
-            safety_task, tone_task, intent_task
-        )
+        Callers that already lowercased the message can pass `message_lower`.
         
-        elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
+        Target latency: <100ms total
+        """
         
-        logger.debug(
-            "metacognition_complete",
-            safety_level=safety.risk_level.value,
-            tone_formality=tone.formality_level,
-            intent_confidence=intent.confidence,
-            elapsed_ms=f"{elapsed:.1f}"
-        )
+        start_ns = time.perf_counter_ns()
+        # Reasoning steps are only ever emitted at debug level
+        collect_reasoning = logger.is_enabled_for(logging.DEBUG)
+        reasoning: List[str] = []
+        internal_log: _ReasoningLog = reasoning if collect_reasoning else _NULL_LOG
+        
+        # Lowercase, split and keyword-scan the message once for all checks
+        if message_lower is None:
+            message_lower = user_message.lower()
+        word_count = len(user_message.split())
+        hits = _KEYWORD_SCANNER.scan(message_lower)
+        
+        # The checks are pure CPU rule evaluation - run them inline rather
+        # than paying task scheduling for work that never awaits. Once the
+        # ambiguous-safety branch makes a real LLM call, only that case
+        # should start a task (asyncio.TaskGroup) and overlap it with the
+        # tone/intent checks; the fast path must stay synchronous.
+        safety = self._check_safety(user_message, message_lower, word_count, hits, internal_log)
+        tone = self._analyze_tone(word_count, hits, emotional_context, mode, internal_log)
+        intent = self._analyze_intent(word_count, hits, conversation_history, internal_log)
+        
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "metacognition_complete",
+                safety_level=safety.risk_level.value,
+                tone_formality=tone.formality_level,
+                intent_confidence=intent.confidence,
+                elapsed_ms=round(elapsed, 1)
+            )
         
         return MetacognitiveResult(
             safety=safety,
             tone=tone,
             intent=intent,
             processing_time_ms=elapsed,
-            internal_reasoning=internal_log
+            internal_reasoning=reasoning
         )
     
-    async def _check_safety(
+    def _check_safety(
         self,
         message: str,
-        log: List[str]
+        message_lower: str,
+        word_count: int,
+        hits: Dict[str, Set[str]],
+        log: _ReasoningLog
     ) -> SafetyCheck:
         """
         Check if message is safe to respond to.
@@ -223,9 +395,10 @@ class MetacognitiveAnalyzer:
         """
         
         # Try fast path first
-        fast_result = self.fast_checker.check_safety(message)
+        fast_result = self.fast_checker.check_safety(message, message_lower, word_count, hits)
         if fast_result:
-            log.append(f"[SAFETY] Fast path: {fast_result.risk_level.value}")
+            if log is not _NULL_LOG:
+                log.append(f"[SAFETY] Fast path: {fast_result.risk_level.value}")
             return fast_result
         
         # Need LLM evaluation for ambiguous case
@@ -241,8 +414,7 @@ class MetacognitiveAnalyzer:
         # For now, simplified logic:
         
         # Check for obvious unsafe patterns
-        unsafe_keywords = ["hack", "exploit", "illegal", "bypass security"]
-        if any(kw in message.lower() for kw in unsafe_keywords):
+        if hits["unsafe"]:
             return SafetyCheck(
                 is_safe=False,
                 risk_level=SafetyLevel.HIGH_RISK,
@@ -257,12 +429,13 @@ class MetacognitiveAnalyzer:
             concerns=[]
         )
     
-    async def _analyze_tone(
+    def _analyze_tone(
         self,
-        message: str,
+        word_count: int,
+        hits: Dict[str, Set[str]],
         emotional_context: Optional[Dict],
         mode: str,
-        log: List[str]
+        log: _ReasoningLog
     ) -> ToneGuidance:
         """
         Analyze what tone/style is appropriate for response.
@@ -282,37 +455,29 @@ class MetacognitiveAnalyzer:
             formality = 3  # More professional
         
         # Message length suggests detail preference
-        message_length = len(message.split())
-        if message_length < 10:
+        if word_count < 10:
             detail = "concise"
-        elif message_length > 50:
+        elif word_count > 50:
             detail = "detailed"  # Match their investment
         
-        # Emotional indicators
-        emotion_keywords = {
-            "stressed": ("high", "high", 4),  # empathy, urgency, formality
-            "urgent": ("medium", "high", 3),
-            "confused": ("high", "medium", 2),
-            "excited": ("medium", "medium", 2),
-            "frustrated": ("high", "high", 3),
-        }
-        
-        for keyword, (emp, urg, form) in emotion_keywords.items():
-            if keyword in message.lower():
-                empathy = emp
-                urgency = urg
-                formality = form
+        # Emotional indicators (first listed keyword wins)
+        emotion_hits = hits["emotion"]
+        if emotion_hits:
+            keyword, empathy, urgency, formality = next(
+                row for row in EMOTION_TONE_TABLE if row[0] in emotion_hits
+            )
+            if log is not _NULL_LOG:
                 log.append(f"[TONE] Detected emotion keyword: {keyword}")
-                break
         
         # Emotional context from Phase 1
         if emotional_context:
             emotion = emotional_context.get("emotion", "neutral")
             if emotion in ["frustrated", "anxious", "sad"]:
                 empathy = "high"
-                log.append(f"[TONE] Veda's emotion ({emotion}) increases empathy")
+                if log is not _NULL_LOG:
+                    log.append(f"[TONE] Veda's emotion ({emotion}) increases empathy")
         
-        reasoning = f"Mode={mode}, message_length={message_length}, detected_mood={empathy}"
+        reasoning = f"Mode={mode}, message_length={word_count}, detected_mood={empathy}"
         
         return ToneGuidance(
             formality_level=formality,
@@ -322,11 +487,12 @@ class MetacognitiveAnalyzer:
             reasoning=reasoning
         )
     
-    async def _analyze_intent(
+    def _analyze_intent(
         self,
-        message: str,
+        word_count: int,
+        hits: Dict[str, Set[str]],
         history: Optional[List[Dict]],
-        log: List[str]
+        log: _ReasoningLog
     ) -> IntentAnalysis:
         """
         Understand what the user is really asking for.
@@ -335,22 +501,20 @@ class MetacognitiveAnalyzer:
         
         log.append("[INTENT] Classifying user intent")
         
-        message_lower = message.lower()
-        
         # Common intent patterns
-        if any(q in message_lower for q in ["how to", "can you", "help me", "show me"]):
+        if hits["intent_help"]:
             primary = "requesting_help"
             confidence = 0.9
-        elif any(q in message_lower for q in ["what is", "explain", "tell me about"]):
+        elif hits["intent_info"]:
             primary = "seeking_information"
             confidence = 0.9
-        elif any(q in message_lower for q in ["error", "not working", "broken", "issue"]):
+        elif hits["intent_troubleshooting"]:
             primary = "troubleshooting"
             confidence = 0.85
-        elif any(q in message_lower for q in ["create", "write", "generate", "make"]):
+        elif hits["intent_creation"]:
             primary = "requesting_creation"
             confidence = 0.9
-        elif any(q in message_lower for q in ["hi", "hello", "hey", "how are you"]):
+        elif hits["intent_greeting"]:
             primary = "greeting"
             confidence = 1.0
         else:
@@ -362,22 +526,22 @@ class MetacognitiveAnalyzer:
         clarification_questions = []
         
         # Vague references need clarification
-        vague_patterns = ["this", "that", "it", "the thing"]
-        if any(vague in message_lower for vague in vague_patterns) and len(message.split()) < 15:
+        if hits["vague"] and word_count < 15:
             if not history or len(history) < 2:
                 requires_clarification = True
                 clarification_questions.append("Could you provide more details about what you're referring to?")
                 confidence *= 0.6
         
         # Very short technical requests need clarification
-        if primary == "troubleshooting" and len(message.split()) < 5:
+        if primary == "troubleshooting" and word_count < 5:
             requires_clarification = True
             clarification_questions.append("What system or component is having the issue?")
             confidence *= 0.7
         
-        log.append(f"[INTENT] Primary: {primary} (confidence: {confidence:.2f})")
-        if requires_clarification:
-            log.append(f"[INTENT] Clarification needed: {len(clarification_questions)} questions")
+        if log is not _NULL_LOG:
+            log.append(f"[INTENT] Primary: {primary} (confidence: {confidence:.2f})")
+            if requires_clarification:
+                log.append(f"[INTENT] Clarification needed: {len(clarification_questions)} questions")
         
         return IntentAnalysis(
             primary_intent=primary,
@@ -405,6 +569,19 @@ class MetacognitivePromptBuilder:
         This tells Veda HOW to respond based on analysis.
         """
         
+        tone = result.tone
+        intent = result.intent
+        
+        # Common case: safe and clear intent - two fixed lines
+        if result.safety.is_safe and not intent.requires_clarification:
+            return (
+                f"TONE: {FORMALITY_LABELS[tone.formality_level]}. "
+                f"Empathy: {tone.empathy_required}. "
+                f"Detail: {tone.detail_level}. "
+                f"Urgency: {tone.urgency}.\n"
+                f"INTENT: {intent.primary_intent} (clear)"
+            )
+        
         guidance_parts = []
         
         # Safety guidance
@@ -415,24 +592,14 @@ class MetacognitivePromptBuilder:
             )
         
         # Tone guidance
-        tone = result.tone
-        formality_map = {
-            1: "very casual and relaxed",
-            2: "casual but clear",
-            3: "balanced professional",
-            4: "formal and careful",
-            5: "highly formal and precise"
-        }
-        
         guidance_parts.append(
-            f"TONE: {formality_map[tone.formality_level]}. "
+            f"TONE: {FORMALITY_LABELS[tone.formality_level]}. "
             f"Empathy: {tone.empathy_required}. "
             f"Detail: {tone.detail_level}. "
             f"Urgency: {tone.urgency}."
         )
         
         # Intent guidance
-        intent = result.intent
         if intent.requires_clarification:
             guidance_parts.append(
                 f"CLARIFICATION NEEDED: User's intent unclear ({intent.confidence:.0%} confidence). "
@@ -463,19 +630,19 @@ class MetacognitiveLogger:
         logger.info(
             "metacognitive_analysis",
             user_id=user_id,
-            processing_ms=f"{result.processing_time_ms:.1f}",
+            processing_ms=round(result.processing_time_ms, 1),
             safety_level=result.safety.risk_level.value,
             is_safe=result.safety.is_safe,
             formality=result.tone.formality_level,
             empathy=result.tone.empathy_required,
             detail=result.tone.detail_level,
             primary_intent=result.intent.primary_intent,
-            intent_confidence=f"{result.intent.confidence:.2f}",
+            intent_confidence=round(result.intent.confidence, 2),
             needs_clarification=result.intent.requires_clarification
         )
         
         # Log internal reasoning (very verbose - debug only)
-        if result.internal_reasoning:
+        if result.internal_reasoning and logger.is_enabled_for(logging.DEBUG):
             logger.debug(
                 "metacognitive_reasoning",
                 user_id=user_id,
@@ -483,6 +650,69 @@ class MetacognitiveLogger:
             )
 
 
+# ============================================================================
+# RESULT CACHE
+# ============================================================================
+
+class AnalysisCache:
+    """
+    Small TTL + LRU cache for analysis results.
+    
+    Without history or emotional context the analysis is a pure function
+    of the lowercased message, the mode and whether an LLM is attached, so
+    recurring messages ("hi", "help me", ...) can skip it entirely.
+    Stored results are never handed out directly; each hit gets a copy.
+    """
+    
+    __slots__ = ("maxsize", "ttl", "_entries")
+    
+    def __init__(self, maxsize: int = 4096, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(message_lower: str, mode: str, has_llm: bool) -> bytes:
+        """Hash the inputs the analysis depends on into a fixed-size key."""
+        raw = f"{mode}|{int(has_llm)}|{message_lower}".encode()
+        return hashlib.blake2b(raw, digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: bytes, value: Any):
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_ANALYSIS_CACHE = AnalysisCache()
+
+
+@lru_cache(maxsize=8)
+def _get_analyzer(llm_client=None) -> MetacognitiveAnalyzer:
+    """Shared analyzer per LLM client (clients are long-lived singletons)."""
+    return MetacognitiveAnalyzer(llm_client=llm_client)
+
+
 # ============================================================================
 # CONVENIENCE WRAPPER
 # ============================================================================
@@ -502,23 +732,50 @@ async def analyze_before_response(
     - result: MetacognitiveResult object
     - guidance: String to inject in system prompt
     - should_respond: Boolean (false if unsafe)
+    
+    Context-free calls (no history, no emotional context) are served from
+    a short-lived exact-match cache.
     """
     
-    analyzer = MetacognitiveAnalyzer(llm_client=llm_client)
+    start_ns = time.perf_counter_ns()
+    message_lower = user_message.lower()
+    cache_key = None
+    cached = None
+    if not conversation_history and not emotional_context:
+        cache_key = AnalysisCache.make_key(message_lower, mode, llm_client is not None)
+        cached = _ANALYSIS_CACHE.get(cache_key)
     
-    result = await analyzer.analyze(
-        user_message=user_message,
-        conversation_history=conversation_history,
-        emotional_context=emotional_context,
-        mode=mode
-    )
+    if cached is not None:
+        # Hand out a private copy stamped with this call's own timing
+        cached_result, guidance = cached
+        result = cached_result.model_copy(
+            deep=True,
+            update={
+                "processing_time_ms": (time.perf_counter_ns() - start_ns) / 1e6,
+                "timestamp": datetime.utcnow(),
+            },
+        )
+    else:
+        analyzer = _get_analyzer(llm_client)
+        
+        result = await analyzer.analyze(
+            user_message=user_message,
+            conversation_history=conversation_history,
+            emotional_context=emotional_context,
+            mode=mode,
+            message_lower=message_lower
+        )
+        
+        # Build guidance
+        guidance = MetacognitivePromptBuilder.build_guidance(result)
+        
+        if cache_key is not None:
+            # Keep our own copy so the caller is free to mutate theirs
+            _ANALYSIS_CACHE.set(cache_key, (result.model_copy(deep=True), guidance))
     
     # Log for debugging
     MetacognitiveLogger.log_analysis(result, user_id)
     
-    # Build guidance
-    guidance = MetacognitivePromptBuilder.build_guidance(result)
-    
     return {
         "result": result,
         "guidance": guidance,
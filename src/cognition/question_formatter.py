@@ -41,6 +41,12 @@ class QuestionFormatter:
         # Returns: "Quick question pops - which system? DEV, QA, or PROD?"
     """
     
+    __slots__ = ("use_variation", "_rng", "templates", "_emphasized")
+    
+    # Appended inside the closing parenthesis when Veda is very uncertain
+    CONTEXT_EMPHASIS = " (I really wanna make sure I get this right for you)"
+    HIGH_UNCERTAINTY_THRESHOLD = 0.7
+    
     def __init__(self, use_variation: bool = True):
         """
         Initialize question formatter.
@@ -49,6 +55,7 @@ class QuestionFormatter:
             use_variation: Use random variation between templates (default True)
         """
         self.use_variation = use_variation
+        self._rng = random.Random()  # Per-instance, avoids the shared module RNG
         self._init_templates()
         
         logger.debug("question_formatter_initialized", use_variation=use_variation)
@@ -120,6 +127,27 @@ class QuestionFormatter:
                 "Which way would you like me to do this?",
             ],
         }
+        
+        # High-uncertainty variants, index-aligned with `templates`
+        self._emphasized = {
+            question_type: [self._emphasize(t) for t in templates]
+            for question_type, templates in self.templates.items()
+        }
+    
+    @classmethod
+    def _emphasize(cls, template: str) -> str:
+        """Add the high-uncertainty emphasis before each closing parenthesis."""
+        return template.replace(")", f"{cls.CONTEXT_EMPHASIS})")
+    
+    def _select(self, question_type: str, table: Dict[str, List[str]]) -> str:
+        """Pick a template of `question_type` from `table`."""
+        templates = table.get(question_type)
+        if templates is None:
+            templates = table["general_clarification"]
+        
+        if self.use_variation:
+            return templates[self._rng.randrange(len(templates))]
+        return templates[0]  # Always use first
     
     def format_question(
         self,
@@ -137,21 +165,9 @@ class QuestionFormatter:
             Formatted question string
         """
         
-        # Get templates for this type
-        templates = self.templates.get(
-            question_type,
-            self.templates["general_clarification"]
-        )
-        
-        # Select template
-        if self.use_variation:
-            template = random.choice(templates)
-        else:
-            template = templates[0]  # Always use first
-        
         # Apply context if available (future enhancement)
         # For now, just return template as-is
-        formatted = template
+        formatted = self._select(question_type, self.templates)
         
         logger.debug(
             "question_formatted",
@@ -179,16 +195,21 @@ class QuestionFormatter:
             Contextually-aware formatted question
         """
         
-        # Get base question
-        base_question = self.format_question(question_type)
+        # Very uncertain - use the variants emphasizing wanting to help correctly
+        if uncertainty_score > self.HIGH_UNCERTAINTY_THRESHOLD:
+            table = self._emphasized
+        else:
+            table = self.templates
+        
+        formatted = self._select(question_type, table)
         
-        # Add context if uncertainty is very high
-        if uncertainty_score > 0.7:
-            # Very uncertain - emphasize wanting to help correctly
-            context_emphasis = " (I really wanna make sure I get this right for you)"
-            base_question = base_question.replace(")", f"{context_emphasis})")
+        logger.debug(
+            "question_formatted",
+            question_type=question_type,
+            length=len(formatted)
+        )
         
-        return base_question
+        return formatted
     
     def get_available_types(self) -> List[str]:
         """Get list of available question types."""
@@ -208,32 +229,47 @@ class QuestionFormatter:
         """
         if question_type not in self.templates:
             self.templates[question_type] = []
+            self._emphasized[question_type] = []
         
         self.templates[question_type].append(template)
+        self._emphasized[question_type].append(self._emphasize(template))
         logger.debug("custom_template_added", question_type=question_type)
 
 
 # Convenience functions
 
+# Shared formatter for the helpers below (templates are built once at import)
+_DEFAULT_FORMATTER = QuestionFormatter(use_variation=False)
+
+
 def format_environment_question() -> str:
     """Quick format: which environment?"""
-    formatter = QuestionFormatter(use_variation=False)
-    return formatter.format_question("which_environment")
+    return _DEFAULT_FORMATTER.format_question("which_environment")
 
 
 def format_pronoun_question() -> str:
     """Quick format: what is 'it'?"""
-    formatter = QuestionFormatter(use_variation=False)
-    return formatter.format_question("what_is_it")
+    return _DEFAULT_FORMATTER.format_question("what_is_it")
 
 
 def format_action_question() -> str:
     """Quick format: which system for action?"""
-    formatter = QuestionFormatter(use_variation=False)
-    return formatter.format_question("which_specific_action")
+    return _DEFAULT_FORMATTER.format_question("which_specific_action")
 
 
 # Question type mapping helpers
+
+# UncertaintyScorer.suggested_question -> QuestionFormatter question type
+UNCERTAINTY_TO_QUESTION_TYPE: Dict[str, str] = {
+    "which_specific": "which_specific_check",
+    "which_environment": "which_environment",
+    "what_specifically": "what_is_it",
+    "what_aspect": "what_help_with",
+    "general_clarification": "general_clarification",
+    "which_instance": "which_instance",
+}
+
+
 def map_uncertainty_type_to_question_type(suggested_type: str) -> str:
     """
     Map uncertainty scorer's suggested type to formatter's question type.
@@ -246,14 +282,4 @@ def map_uncertainty_type_to_question_type(suggested_type: str) -> str:
     Returns:
         Question type for QuestionFormatter
     """
-    
-    mapping = {
-        "which_specific": "which_specific_check",
-        "which_environment": "which_environment",
-        "what_specifically": "what_is_it",
-        "what_aspect": "what_help_with",
-        "general_clarification": "general_clarification",
-        "which_instance": "which_instance",
-    }
-    
-    return mapping.get(suggested_type, "general_clarification")
+    return UNCERTAINTY_TO_QUESTION_TYPE.get(suggested_type, "general_clarification")
@@ -15,18 +15,178 @@ Design philosophy:
 - Expired after reasonable time (24 hours)
 """
 
-import json
+import base64
+import hashlib
+import time
+import zlib
 import asyncio
 from typing import Optional, List, Dict
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, fields
+from datetime import datetime
+import orjson
 import structlog
 import redis.asyncio as aioredis
 
 logger = structlog.get_logger()
 
 
-@dataclass
+# Shared Redis connection pools keyed by URL - queues constructed per
+# conversation reuse the same sockets instead of each opening a pool.
+_POOLS: Dict[str, aioredis.ConnectionPool] = {}
+
+
+def _get_pool(redis_url: str, max_connections: int) -> aioredis.ConnectionPool:
+    """Get (or lazily create) the shared connection pool for a Redis URL."""
+    pool = _POOLS.get(redis_url)
+    if pool is None:
+        pool = _POOLS.setdefault(
+            redis_url,
+            aioredis.ConnectionPool.from_url(
+                redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                max_connections=max_connections
+            )
+        )
+    return pool
+
+
+# Held (SET NX, expiring after one compaction interval) by whichever queue
+# sweeps next, so the keyspace SCAN runs once per interval across all queue
+# instances and worker processes sharing this Redis, not once per instance.
+COMPACT_LOCK_KEY = "veda:curiosity:compact_lock"
+
+
+# ============================================================================
+# LUA SCRIPTS (run atomically on the Redis server, one round trip each)
+# ============================================================================
+
+# Questions live in one hash per conversation (field = question_id), next
+# to the priority ZSET. Hash fields have no TTL of their own, so a third
+# ZSET scores each question id by its creation time (unix ms); everything
+# scored below `cutoff_ms` has expired and is purged server-side with
+# ZRANGEBYSCORE/ZREMRANGEBYSCORE, without decoding any question JSON.
+# A fourth hash maps SHA-1 fingerprints of the normalized question text to
+# question ids, so duplicate detection is a single HGET.
+#
+# Every script takes KEYS[1] = queue_key, KEYS[2] = questions_key,
+# KEYS[3] = created_key, KEYS[4] = seen_key.
+
+# Shared prologue: `forget` drops a question's fingerprint (only if it still
+# points at that question), `purge_expired` drops expired questions from
+# all four structures.
+_HELPERS_LUA = """
+local function forget(id, raw)
+    local fp = raw and cjson.decode(raw).fingerprint
+    if fp and redis.call('HGET', KEYS[4], fp) == id then
+        redis.call('HDEL', KEYS[4], fp)
+    end
+end
+local function purge_expired(cutoff_ms)
+    local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', '(' .. cutoff_ms)
+    for _, id in ipairs(expired) do
+        forget(id, redis.call('HGET', KEYS[2], id))
+        redis.call('ZREM', KEYS[1], id)
+        redis.call('HDEL', KEYS[2], id)
+    end
+    if #expired > 0 then
+        redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', '(' .. cutoff_ms)
+    end
+    return #expired
+end
+"""
+
+# Purge expired, dedupe by fingerprint against queued questions, then
+# store + enqueue. The dedupe is a single O(1) HGET inside the same
+# round trip as the write, so a Bloom filter in front of it (RedisBloom or
+# in-process) would save neither a round trip nor a decode.
+# ARGV: question_id, fingerprint, priority, expiry_seconds,
+#       question_json, created_ms, cutoff_ms
+# Returns {1, question_id} when added, {0, existing_id} for a duplicate.
+ADD_QUESTION_SCRIPT = _HELPERS_LUA + """
+purge_expired(ARGV[7])
+local existing = redis.call('HGET', KEYS[4], ARGV[2])
+if existing and redis.call('ZSCORE', KEYS[1], existing)
+        and redis.call('HEXISTS', KEYS[2], existing) == 1 then
+    return {0, existing}
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[5])
+redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+redis.call('ZADD', KEYS[3], ARGV[6], ARGV[1])
+redis.call('HSET', KEYS[4], ARGV[2], ARGV[1])
+for i = 1, 4 do
+    redis.call('EXPIRE', KEYS[i], ARGV[4])
+end
+return {1, ARGV[1]}
+"""
+
+# Claim the highest-priority question: cooldown check, expiry/max-attempt
+# cleanup, start cooldown and dequeue. The caller bumps `attempts`.
+# KEYS[5] = cooldown_key
+# ARGV: max_attempts, cooldown_seconds, cutoff_ms
+# Returns {'cooldown'}, {'empty'}, {'expired', id} (queued id whose
+# question is gone), {'max_attempts', id, attempts} or
+# {'claimed', id, question_json}.
+CLAIM_QUESTION_SCRIPT = _HELPERS_LUA + """
+if redis.call('EXISTS', KEYS[5]) == 1 then
+    return {'cooldown'}
+end
+purge_expired(ARGV[3])
+local ids = redis.call('ZREVRANGE', KEYS[1], 0, 0)
+if #ids == 0 then
+    return {'empty'}
+end
+local id = ids[1]
+local raw = redis.call('HGET', KEYS[2], id)
+if not raw then
+    redis.call('ZREM', KEYS[1], id)
+    redis.call('ZREM', KEYS[3], id)
+    return {'expired', id}
+end
+local attempts = tonumber(cjson.decode(raw).attempts) or 0
+if attempts >= tonumber(ARGV[1]) then
+    forget(id, raw)
+    redis.call('ZREM', KEYS[1], id)
+    redis.call('HDEL', KEYS[2], id)
+    redis.call('ZREM', KEYS[3], id)
+    return {'max_attempts', id, attempts}
+end
+redis.call('SETEX', KEYS[5], ARGV[2], '1')
+redis.call('ZREM', KEYS[1], id)
+return {'claimed', id, raw}
+"""
+
+# Remove one question (and its fingerprint) from every structure.
+# ARGV: question_id
+REMOVE_QUESTION_SCRIPT = _HELPERS_LUA + """
+forget(ARGV[1], redis.call('HGET', KEYS[2], ARGV[1]))
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return 1
+"""
+
+# Purge expired questions and drop queue/creation-index ids whose question
+# data is gone (e.g. the hash expired on its own), so claims never have to
+# discover them one at a time.
+# ARGV: cutoff_ms
+# Returns the number of ids cleaned.
+COMPACT_QUEUE_SCRIPT = _HELPERS_LUA + """
+local cleaned = purge_expired(ARGV[1])
+for _, key in ipairs({KEYS[1], KEYS[3]}) do
+    local ids = redis.call('ZRANGE', key, 0, -1)
+    for _, id in ipairs(ids) do
+        if redis.call('HEXISTS', KEYS[2], id) == 0 then
+            redis.call('ZREM', key, id)
+            cleaned = cleaned + 1
+        end
+    end
+end
+return cleaned
+"""
+
+
+@dataclass(slots=True)
 class PendingQuestion:
     """
     A question waiting to be asked.
@@ -90,7 +250,10 @@ class QuestionQueue:
         redis_url: str = "redis://localhost:6380",
         cooldown_seconds: int = 60,
         max_attempts: int = 3,
-        expiry_hours: int = 24
+        expiry_hours: int = 24,
+        redis_client: Optional[aioredis.Redis] = None,
+        max_connections: int = 50,
+        compact_interval_seconds: Optional[float] = 300
     ):
         """
         Initialize question queue.
@@ -100,12 +263,26 @@ class QuestionQueue:
             cooldown_seconds: Minimum seconds between questions (default: 60)
             max_attempts: Max times to try asking before giving up (default: 3)
             expiry_hours: Hours until question expires (default: 24)
+            redis_client: Existing client to use (must decode responses);
+                by default a client on the process-wide pool for `redis_url`
+            max_connections: Size of the shared pool if this queue creates it
+            compact_interval_seconds: How often every conversation queue is
+                compacted (default: 300; None disables it). Each instance runs
+                a timer, but only one sweep per interval happens per Redis.
         """
         self.redis_url = redis_url
         self.cooldown_seconds = cooldown_seconds
         self.max_attempts = max_attempts
         self.expiry_hours = expiry_hours
-        self.redis_client: Optional[aioredis.Redis] = None
+        self.max_connections = max_connections
+        self.compact_interval_seconds = compact_interval_seconds
+        self.redis_client: Optional[aioredis.Redis] = redis_client
+        self._owns_client = redis_client is None
+        self._add_script = None
+        self._claim_script = None
+        self._remove_script = None
+        self._compact_script = None
+        self._compact_task: Optional[asyncio.Task] = None
         
         logger.info(
             "question_queue_initialized",
@@ -117,22 +294,43 @@ class QuestionQueue:
     async def initialize(self):
         """Connect to Redis."""
         try:
-            self.redis_client = await aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
+            if self.redis_client is None:
+                self.redis_client = aioredis.Redis(
+                    connection_pool=_get_pool(self.redis_url, self.max_connections)
+                )
             # Test connection
             await self.redis_client.ping()
+            
+            # Scripts are sent by SHA (EVALSHA) and loaded on first use
+            self._add_script = self.redis_client.register_script(ADD_QUESTION_SCRIPT)
+            self._claim_script = self.redis_client.register_script(CLAIM_QUESTION_SCRIPT)
+            self._remove_script = self.redis_client.register_script(REMOVE_QUESTION_SCRIPT)
+            self._compact_script = self.redis_client.register_script(COMPACT_QUEUE_SCRIPT)
+            
+            if self.compact_interval_seconds and (
+                self._compact_task is None or self._compact_task.done()
+            ):
+                self._compact_task = asyncio.create_task(self._compact_loop())
             logger.info("question_queue_connected", redis_url=self.redis_url)
         except Exception as e:
             logger.error("question_queue_connection_failed", error=str(e))
             raise
     
     async def close(self):
-        """Close Redis connection."""
-        if self.redis_client:
-            await self.redis_client.close()
+        """
+        Release this queue's Redis client.
+        
+        Stops the background compaction task. Injected clients are left open
+        for their owner, and the shared pool stays open for other queues in
+        the process.
+        """
+        if self._compact_task:
+            self._compact_task.cancel()
+            self._compact_task = None
+        
+        if self.redis_client and self._owns_client:
+            await self.redis_client.aclose()
+            self.redis_client = None
             logger.debug("question_queue_closed")
     
     async def add_question(
@@ -160,19 +358,9 @@ class QuestionQueue:
         if not self.redis_client:
             raise RuntimeError("Queue not initialized. Call initialize() first.")
         
-        # Generate question ID
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-        question_id = f"q_{conversation_id}_{timestamp}"
-        
-        # Check for duplicate (same question type in conversation)
-        duplicate = await self._check_duplicate(conversation_id, question_text)
-        if duplicate:
-            logger.debug(
-                "question_duplicate_skipped",
-                conversation_id=conversation_id,
-                question_preview=question_text[:50]
-            )
-            return duplicate
+        # Generate question ID (nanosecond clock, no datetime formatting)
+        now_ns = time.time_ns()
+        question_id = f"q_{conversation_id}_{now_ns}"
         
         # Create question object
         question = PendingQuestion(
@@ -181,25 +369,34 @@ class QuestionQueue:
             conversation_id=conversation_id,
             user_id=user_id,
             priority=priority,
-            created_at=datetime.now().isoformat(),
+            created_at=datetime.fromtimestamp(now_ns / 1e9).isoformat(),
             context=context or {},
             attempts=0
         )
         
-        # Store in Redis
-        key = self._get_question_key(question_id)
-        value = json.dumps(asdict(question))
-        
-        # Set with expiry
-        expiry_seconds = self.expiry_hours * 3600
-        await self.redis_client.setex(key, expiry_seconds, value)
-        
-        # Add to priority queue (sorted set by priority)
-        queue_key = self._get_queue_key(conversation_id)
-        await self.redis_client.zadd(queue_key, {question_id: priority})
+        # Purge expired, dedupe (same normalized text queued in this
+        # conversation), store with expiry and add to the priority queue
+        # (sorted set by priority) and creation-time index atomically
+        added, stored_id = await self._add_script(
+            keys=self._get_keys(conversation_id),
+            args=[
+                question_id,
+                self._fingerprint(question_text),
+                priority,
+                self.expiry_hours * 3600,
+                self._serialize(question),
+                now_ns // 1_000_000,
+                self._expiry_cutoff_ms(),
+            ],
+        )
         
-        # Set queue expiry too
-        await self.redis_client.expire(queue_key, expiry_seconds)
+        if not added:
+            logger.debug(
+                "question_duplicate_skipped",
+                conversation_id=conversation_id,
+                question_preview=question_text[:50]
+            )
+            return stored_id
         
         logger.info(
             "question_queued",
@@ -235,8 +432,19 @@ class QuestionQueue:
         if not self.redis_client:
             raise RuntimeError("Queue not initialized. Call initialize() first.")
         
-        # Check cooldown
-        if not await self._check_cooldown(conversation_id):
+        # Cooldown check, priority pick and dequeue happen atomically, so
+        # two workers can never pull the same question
+        questions_key = self._get_questions_key(conversation_id)
+        claim = await self._claim_script(
+            keys=[
+                *self._get_keys(conversation_id),
+                self._get_cooldown_key(conversation_id),
+            ],
+            args=[self.max_attempts, self.cooldown_seconds, self._expiry_cutoff_ms()],
+        )
+        status = claim[0]
+        
+        if status == "cooldown":
             logger.debug(
                 "question_cooldown_active",
                 conversation_id=conversation_id,
@@ -244,58 +452,36 @@ class QuestionQueue:
             )
             return None
         
-        # Get highest priority question
-        queue_key = self._get_queue_key(conversation_id)
-        
-        # ZREVRANGE gets highest score first (reverse order)
-        results = await self.redis_client.zrevrange(queue_key, 0, 0)
-        
-        if not results:
+        if status == "empty":
             logger.debug("question_queue_empty", conversation_id=conversation_id)
             return None
         
-        question_id = results[0]
-        
-        # Retrieve full question
-        question_key = self._get_question_key(question_id)
-        question_json = await self.redis_client.get(question_key)
+        question_id = claim[1]
         
-        if not question_json:
-            # Question expired, remove from queue
-            await self.redis_client.zrem(queue_key, question_id)
+        if status == "expired":
             logger.debug("question_expired", question_id=question_id)
             return None
         
-        question_data = json.loads(question_json)
-        question = PendingQuestion(**question_data)
-        
-        # Check max attempts
-        if question.attempts >= self.max_attempts:
-            # Give up, remove from queue
-            await self._remove_question(question_id, conversation_id)
+        if status == "max_attempts":
             logger.info(
                 "question_max_attempts_reached",
                 question_id=question_id,
-                attempts=question.attempts
+                attempts=claim[2]
             )
             return None
         
-        # Update attempt tracking
+        question = self._deserialize(claim[2])
+        
+        # Update attempt tracking (re-encoded here rather than in Lua, where
+        # cjson would turn empty lists in `context` into objects)
         question.attempts += 1
         question.last_attempt = datetime.now().isoformat()
         
-        # Save updated question
-        await self.redis_client.setex(
-            question_key,
-            self.expiry_hours * 3600,
-            json.dumps(asdict(question))
-        )
-        
-        # Record cooldown
-        await self._record_cooldown(conversation_id)
-        
-        # Remove from queue (will be re-added if not actually asked)
-        await self.redis_client.zrem(queue_key, question_id)
+        # Save updated question (it stays retrievable for requeue_question)
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.hset(questions_key, question_id, self._serialize(question))
+            pipe.expire(questions_key, self.expiry_hours * 3600)
+            await pipe.execute()
         
         logger.info(
             "question_retrieved",
@@ -350,27 +536,28 @@ class QuestionQueue:
         Get statistics about conversation's question queue.
         
         Returns:
-            Dict with count, highest_priority, oldest_question
+            Dict with count, highest_priority, oldest_question_id and
+            oldest_created_ms (creation time in unix ms)
         """
         queue_key = self._get_queue_key(conversation_id)
         
-        # Get count
-        count = await self.redis_client.zcard(queue_key)
+        # Count, highest priority and oldest (by creation time) in one round trip
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.zcard(queue_key)
+            pipe.zrevrange(queue_key, 0, 0, withscores=True)
+            pipe.zrange(self._get_created_key(conversation_id), 0, 0, withscores=True)
+            count, highest, oldest = await pipe.execute()
         
         if count == 0:
             return {"count": 0}
         
-        # Get highest priority
-        highest = await self.redis_client.zrevrange(queue_key, 0, 0, withscores=True)
         highest_priority = highest[0][1] if highest else 0.0
         
-        # Get oldest (first in queue)
-        oldest_id = await self.redis_client.zrange(queue_key, 0, 0)
-        
         stats = {
             "count": count,
             "highest_priority": highest_priority,
-            "oldest_question_id": oldest_id[0] if oldest_id else None
+            "oldest_question_id": oldest[0][0] if oldest else None,
+            "oldest_created_ms": int(oldest[0][1]) if oldest else None
         }
         
         return stats
@@ -382,23 +569,147 @@ class QuestionQueue:
         """Clear all questions for a conversation."""
         queue_key = self._get_queue_key(conversation_id)
         
-        # Get all question IDs
-        question_ids = await self.redis_client.zrange(queue_key, 0, -1)
+        # Count queued questions, then unlink queue, question hash, creation
+        # index and fingerprints in one round trip (UNLINK frees memory in
+        # the background)
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            pipe.zcard(queue_key)
+            pipe.unlink(*self._get_keys(conversation_id))
+            count, _ = await pipe.execute()
+        
+        logger.info("conversation_queue_cleared", conversation_id=conversation_id, count=count)
+    
+    async def compact(self, conversation_id: str) -> int:
+        """
+        Purge expired questions and stale queue entries for a conversation.
+        
+        Returns:
+            Number of entries cleaned
+        """
+        if not self.redis_client:
+            raise RuntimeError("Queue not initialized. Call initialize() first.")
+        
+        cleaned = await self._compact_script(
+            keys=self._get_keys(conversation_id),
+            args=[self._expiry_cutoff_ms()],
+        )
+        
+        if cleaned:
+            logger.debug("question_queue_compacted", conversation_id=conversation_id, cleaned=cleaned)
+        
+        return cleaned
+    
+    async def compact_all(self) -> int:
+        """
+        Compact every conversation queue (SCAN, so Redis is never blocked).
+        
+        Returns:
+            Total number of entries cleaned
+        """
+        if not self.redis_client:
+            raise RuntimeError("Queue not initialized. Call initialize() first.")
+        
+        prefix = self._get_queue_key("")
+        total = 0
+        async for key in self.redis_client.scan_iter(match=f"{prefix}*", count=500):
+            total += await self.compact(key[len(prefix):])
+        
+        if total:
+            logger.info("question_queues_compacted", cleaned=total)
+        
+        return total
+    
+    async def compact_all_if_due(self) -> Optional[int]:
+        """
+        Run compact_all() unless another queue already swept this interval.
+        
+        Returns:
+            Total number of entries cleaned, or None if the sweep was skipped
+        """
+        if not self.redis_client:
+            raise RuntimeError("Queue not initialized. Call initialize() first.")
         
-        # Delete each question
-        for qid in question_ids:
-            await self.redis_client.delete(self._get_question_key(qid))
+        acquired = await self.redis_client.set(
+            COMPACT_LOCK_KEY,
+            "1",
+            nx=True,
+            px=int(self.compact_interval_seconds * 1000)
+        )
+        if not acquired:
+            return None
+        return await self.compact_all()
+    
+    async def _compact_loop(self):
+        """Background task: sweep all queues every `compact_interval_seconds` (if due)."""
+        while True:
+            await asyncio.sleep(self.compact_interval_seconds)
+            try:
+                await self.compact_all_if_due()
+            except Exception as e:
+                logger.warning("question_queue_compact_failed", error=str(e))
+    
+    # Serialization
+    
+    # Contexts at least this large (serialized) are stored zlib-compressed
+    COMPRESS_MIN_BYTES = 1024
+    
+    # json.dumps compatibility: stringify non-str context keys
+    JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+    
+    QUESTION_FIELDS = tuple(field.name for field in fields(PendingQuestion))
+    
+    @classmethod
+    def _serialize(cls, question: PendingQuestion) -> bytes:
+        """
+        Encode a question as JSON (orjson) for Redis.
         
-        # Delete queue
-        await self.redis_client.delete(queue_key)
+        Large `context` payloads go into `context_z` as base64 zlib data
+        (Redis replies are decoded as text). Top-level fields stay plain
+        JSON so the Lua scripts can still read `attempts`/`fingerprint`.
         
-        logger.info("conversation_queue_cleared", conversation_id=conversation_id, count=len(question_ids))
+        Fields are read straight off the dataclass (no asdict() deep copy),
+        and `context` is encoded once and embedded as a Fragment.
+        """
+        data = {name: getattr(question, name) for name in cls.QUESTION_FIELDS}
+        data["fingerprint"] = cls._fingerprint(question.question_text)
+        context_json = orjson.dumps(question.context, option=cls.JSON_OPTIONS)
+        data["context"] = orjson.Fragment(context_json)
+        if len(context_json) >= cls.COMPRESS_MIN_BYTES:
+            packed = base64.b64encode(zlib.compress(context_json)).decode("ascii")
+            if len(packed) < len(context_json):
+                del data["context"]
+                data["context_z"] = packed
+        return orjson.dumps(data, option=cls.JSON_OPTIONS)
+    
+    @staticmethod
+    def _deserialize(raw: str) -> PendingQuestion:
+        """Decode a stored question, compressed context or not."""
+        data = orjson.loads(raw)
+        data.pop("fingerprint", None)
+        packed = data.pop("context_z", None)
+        if packed is not None:
+            data["context"] = orjson.loads(zlib.decompress(base64.b64decode(packed)))
+        return PendingQuestion(**data)
     
     # Private helper methods
     
-    def _get_question_key(self, question_id: str) -> str:
-        """Get Redis key for question data."""
-        return f"veda:curiosity:question:{question_id}"
+    @staticmethod
+    def _fingerprint(question_text: str) -> str:
+        """SHA-1 of the normalized question text, used for deduplication."""
+        return hashlib.sha1(question_text.lower().strip().encode()).hexdigest()
+    
+    def _get_keys(self, conversation_id: str) -> List[str]:
+        """Keys shared by the Lua scripts: queue, questions, created, seen."""
+        return [
+            self._get_queue_key(conversation_id),
+            self._get_questions_key(conversation_id),
+            self._get_created_key(conversation_id),
+            self._get_seen_key(conversation_id),
+        ]
+    
+    def _get_questions_key(self, conversation_id: str) -> str:
+        """Get Redis key for conversation's question data (hash by question ID)."""
+        return f"veda:curiosity:questions:{conversation_id}"
     
     def _get_queue_key(self, conversation_id: str) -> str:
         """Get Redis key for conversation's question queue."""
@@ -408,43 +719,21 @@ class QuestionQueue:
         """Get Redis key for cooldown tracking."""
         return f"veda:curiosity:cooldown:{conversation_id}"
     
-    async def _check_duplicate(
-        self,
-        conversation_id: str,
-        question_text: str
-    ) -> Optional[str]:
-        """Check if similar question already queued."""
-        queue_key = self._get_queue_key(conversation_id)
-        question_ids = await self.redis_client.zrange(queue_key, 0, -1)
-        
-        # Simple duplicate check (exact text match)
-        for qid in question_ids:
-            q_key = self._get_question_key(qid)
-            q_json = await self.redis_client.get(q_key)
-            if q_json:
-                q_data = json.loads(q_json)
-                if q_data.get("question_text") == question_text:
-                    return qid
-        
-        return None
-    
-    async def _check_cooldown(self, conversation_id: str) -> bool:
-        """Check if cooldown period has passed."""
-        cooldown_key = self._get_cooldown_key(conversation_id)
-        exists = await self.redis_client.exists(cooldown_key)
-        return not exists  # True if cooldown expired
-    
-    async def _record_cooldown(self, conversation_id: str):
-        """Record that a question was asked (start cooldown)."""
-        cooldown_key = self._get_cooldown_key(conversation_id)
-        await self.redis_client.setex(cooldown_key, self.cooldown_seconds, "1")
+    def _get_created_key(self, conversation_id: str) -> str:
+        """Get Redis key for the creation-time index (score = unix ms)."""
+        return f"veda:curiosity:created:{conversation_id}"
+    
+    def _get_seen_key(self, conversation_id: str) -> str:
+        """Get Redis key for question fingerprints (hash of fingerprint -> ID)."""
+        return f"veda:curiosity:seen:{conversation_id}"
+    
+    def _expiry_cutoff_ms(self) -> int:
+        """Questions created before this unix-ms time have expired."""
+        return int((time.time() - self.expiry_hours * 3600) * 1000)
     
     async def _remove_question(self, question_id: str, conversation_id: str):
-        """Remove question from queue and storage."""
-        # Remove from queue
-        queue_key = self._get_queue_key(conversation_id)
-        await self.redis_client.zrem(queue_key, question_id)
-        
-        # Remove question data
-        question_key = self._get_question_key(question_id)
-        await self.redis_client.delete(question_key)
+        """Remove question from queue, storage and dedupe fingerprints."""
+        await self._remove_script(
+            keys=self._get_keys(conversation_id),
+            args=[question_id],
+        )
@@ -0,0 +1,68 @@
+"""
+Admission control for in-flight completions (used by the API server).
+"""
+
+import asyncio
+from collections import deque
+
+
+class AdmissionControl:
+    """
+    Bounded admission for in-flight completions.
+    
+    Works like a semaphore whose `limit` can be changed at runtime: raising
+    it admits waiters immediately, lowering it lets in-flight requests drain.
+    Release is synchronous (no await), so a slot is returned even when a
+    stream is torn down by cancellation.
+    """
+    
+    def __init__(self, limit: int):
+        self._limit = limit
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+    
+    @property
+    def limit(self) -> int:
+        return self._limit
+    
+    @limit.setter
+    def limit(self, value: int):
+        self._limit = value
+        self._wake()
+    
+    async def __aenter__(self):
+        if self.in_flight < self._limit and not self._waiters:
+            self.in_flight += 1
+            return self
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was granted just as we were cancelled: hand it on
+                self._release()
+            else:
+                # _wake may already have dropped the cancelled waiter
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self._release()
+    
+    def _release(self):
+        self.in_flight -= 1
+        self._wake()
+    
+    def _wake(self):
+        """Grant freed slots to waiters in FIFO order."""
+        while self._waiters and self.in_flight < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
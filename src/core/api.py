@@ -4,21 +4,26 @@ Adds: Emotion persistence, background tasks, Redis integration
 """
 
 import asyncio
-import json
+import logging
+import re
 import time
 import os
-from typing import Optional, List, Dict, Any
-from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable
+from contextlib import aclosing, asynccontextmanager
+from functools import partial
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
+import orjson
 import structlog
 
 from dotenv import load_dotenv
 
+from .admission import AdmissionControl
 from .openrouter_client import OpenRouterClient
 from .orchestrator import VedaOrchestrator
 from ..brain.memory_manager import MemoryManager
@@ -31,13 +36,25 @@ from ..cognition.emotion_manager import (
     PADState
 )
 
-# Configure logging
+# Env (.env) is read at import: LOG_LEVEL and VEDA_CORS_ORIGINS apply below
+load_dotenv()
+
+# Configure logging (orjson renders straight to bytes for the bytes logger).
+# The filtering bound logger turns calls below LOG_LEVEL into no-ops before
+# any processor runs, so hot-path debug lines cost nothing in production.
 structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(
+        getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO)
+    ),
+    cache_logger_on_first_use=True,
     processors=[
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
-        structlog.processors.JSONRenderer()
-    ]
+        structlog.processors.JSONRenderer(
+            serializer=partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+        )
+    ],
+    logger_factory=structlog.BytesLoggerFactory()
 )
 
 logger = structlog.get_logger()
@@ -49,6 +66,52 @@ emotion_manager: Optional[EmotionManager] = None
 emotion_prompt_gen: Optional[EmotionPromptGenerator] = None
 
 
+# Ceiling on concurrent completions (streams count until they finish)
+admission = AdmissionControl(int(os.getenv("VEDA_MAX_INFLIGHT", "64")))
+
+# /health timestamp, formatted once per tick instead of once per probe
+HEALTH_TIMESTAMP_REFRESH_SECONDS = 1.0
+health_timestamp: Optional[str] = None
+
+
+# /health reuses the last Redis ping result for this long
+EMOTION_HEALTH_TTL_SECONDS = 2.0
+EMOTION_PING_TIMEOUT_SECONDS = 1.0
+_emotion_health: Dict[str, Any] = {"status": "unknown", "ts": 0.0}
+_emotion_ping_lock = asyncio.Lock()
+
+
+async def emotion_health() -> str:
+    """
+    Emotion store status for /health, cached for EMOTION_HEALTH_TTL_SECONDS.
+    
+    At most one ping is in flight; concurrent probes get the cached status
+    instead of queueing behind Redis.
+    """
+    if (
+        time.monotonic() - _emotion_health["ts"] < EMOTION_HEALTH_TTL_SECONDS
+        or _emotion_ping_lock.locked()
+    ):
+        return _emotion_health["status"]
+    
+    async with _emotion_ping_lock:
+        try:
+            ok = await asyncio.wait_for(emotion_store.ping(), EMOTION_PING_TIMEOUT_SECONDS)
+        except TimeoutError:
+            ok = False
+        _emotion_health["status"] = "healthy" if ok else "degraded"
+        _emotion_health["ts"] = time.monotonic()
+    return _emotion_health["status"]
+
+
+async def refresh_health_timestamp():
+    """Background task: keep `health_timestamp` current."""
+    global health_timestamp
+    while True:
+        health_timestamp = datetime.now().isoformat()
+        await asyncio.sleep(HEALTH_TIMESTAMP_REFRESH_SECONDS)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown lifecycle with Veda 3.0 cognitive features."""
@@ -85,12 +148,15 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("veda_3.0_emotion_system_degraded", error=str(e))
     
+    health_ticker = asyncio.create_task(refresh_health_timestamp())
+    
     logger.info("veda_3.0_initialized_successfully")
     
     yield
     
     # Shutdown
     logger.info("veda_3.0_shutdown_started")
+    health_ticker.cancel()
     await memory.close()
     await client.close()
     if emotion_store:
@@ -98,27 +164,51 @@ async def lifespan(app: FastAPI):
     logger.info("veda_3.0_shutdown_complete")
 
 
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    
+    Defined here rather than using fastapi.responses.ORJSONResponse, which
+    newer FastAPI releases deprecate.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     title="Veda 3.0 AI API",
     description="OpenAI-compatible API with Brain-Inspired Cognitive Architecture",
     version="3.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse
 )
 
-# CORS middleware
+# Headers carrying the caller's user id when the body has no `user`
+# (Open-WebUI sends X-OpenWebUI-User-Id with ENABLE_FORWARD_USER_INFO_HEADERS)
+USER_ID_HEADERS = ("x-user-id", "x-openwebui-user-id")
+
+# CORS middleware: browsers may only call in from the configured UI origins
+# (comma-separated VEDA_CORS_ORIGINS); a wildcard is not valid together
+# with credentials
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[
+        origin.strip()
+        for origin in os.getenv("VEDA_CORS_ORIGINS", "http://localhost:3000").split(",")
+        if origin.strip()
+    ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["authorization", "content-type", *USER_ID_HEADERS],
 )
 
 
 # OpenAI-compatible Request Models
 class ChatMessage(BaseModel):
     role: str
-    content: str | List[Dict[str, Any]]  # Support multimodal
+    # Support multimodal; plain text is by far the common case, so try it first
+    content: str | List[Dict[str, Any]] = Field(union_mode="left_to_right")
 
 
 class ChatCompletionRequest(BaseModel):
@@ -130,6 +220,59 @@ class ChatCompletionRequest(BaseModel):
     user: Optional[str] = Field(default="default_user")  # For emotion tracking
 
 
+# Most completions one batch call may carry (VEDA_MAX_BATCH)
+MAX_BATCH_REQUESTS = int(os.getenv("VEDA_MAX_BATCH", "16"))
+
+
+class BatchChatRequest(BaseModel):
+    requests: List[ChatCompletionRequest]
+
+
+# Multimodal messages with at least this many parts are parsed off the event
+# loop (below it, the thread hop costs more than the parsing)
+OFFLOAD_PARTS_THRESHOLD = 1024
+
+
+def resolve_user_id(
+    request: ChatCompletionRequest,
+    raw_request: Optional[Request] = None
+) -> str:
+    """Pick the user id for emotion tracking and the conversation thread."""
+    if "user" in request.model_fields_set and request.user:
+        return request.user
+    
+    if raw_request is not None:
+        for header in USER_ID_HEADERS:
+            value = raw_request.headers.get(header)
+            if value:
+                return value
+    
+    return request.user or "default_user"
+
+
+def extract_message_text(
+    content: str | List[Dict[str, Any]]
+) -> tuple[str, Optional[List[Dict[str, Any]]]]:
+    """
+    Split message content into its text and the multimodal payload.
+    
+    Returns:
+        (message_text, full_message_payload); the payload is None for
+        text-only messages
+    """
+    if isinstance(content, list):
+        # Multimodal message - extract text and keep full payload (one join,
+        # never += per part, so many-part messages stay linear)
+        return " ".join([
+            item.get("text", "") 
+            for item in content 
+            if item.get("type") == "text"
+        ]), content
+    
+    # Text-only message
+    return content, None
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -141,27 +284,33 @@ async def root():
     }
 
 
+# The model list never changes while the server runs: serialize it once
+# (`created` is the server start time)
+MODELS_BODY = orjson.dumps({
+    "object": "list",
+    "data": [
+        {
+            "id": "veda-v3",
+            "object": "model",
+            "created": int(time.time()),
+            "owned_by": "veda",
+            "description": "Veda 3.0 with cognitive architecture"
+        }
+    ]
+})
+
+
 @app.get("/v1/models")
 async def list_models():
     """List available models (OpenAI compatibility)."""
-    return {
-        "object": "list",
-        "data": [
-            {
-                "id": "veda-v3",
-                "object": "model",
-                "created": int(time.time()),
-                "owned_by": "veda",
-                "description": "Veda 3.0 with cognitive architecture"
-            }
-        ]
-    }
+    return Response(content=MODELS_BODY, media_type="application/json")
 
 
 @app.post("/v1/chat/completions")
 async def chat_completions(
     request: ChatCompletionRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    raw_request: Request
 ):
     """
     OpenAI-compatible chat completions endpoint with Veda 3.0 cognitive features.
@@ -175,26 +324,98 @@ async def chat_completions(
     if not veda:
         raise HTTPException(status_code=503, detail="Veda is starting up")
     
+    if request.stream:
+        message_text, full_message_payload, user_id, thread_id, emotional_context = (
+            await prepare_request(request, raw_request)
+        )
+        # Frames are already SSE-encoded bytes, which EventSourceResponse
+        # sends as-is; it adds keep-alive pings and stops the generator when
+        # the client disconnects
+        return EventSourceResponse(
+            coalesce_frames(stream_generator(
+                message_text,
+                thread_id,
+                full_message_payload,
+                emotional_context,
+                user_id,
+                background_tasks
+            )),
+            ping=SSE_PING_SECONDS
+        )
+    
+    # Returned as a response so FastAPI skips jsonable_encoder on the body
+    return OrjsonResponse(await run_completion(request, background_tasks, raw_request))
+
+
+@app.post("/v1/chat/completions/batch")
+async def chat_completions_batch(
+    request: BatchChatRequest,
+    background_tasks: BackgroundTasks,
+    raw_request: Request
+):
+    """
+    Run several non-streaming completions in one HTTP round trip.
+    
+    Requests run concurrently (still subject to admission control). Each
+    entry of `responses` is a chat.completion object, or an `error` object
+    if that request failed; one failure does not fail the batch.
+    """
+    
+    if not veda:
+        raise HTTPException(status_code=503, detail="Veda is starting up")
+    
+    if len(request.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds {MAX_BATCH_REQUESTS} requests"
+        )
+    
+    if any(item.stream for item in request.requests):
+        raise HTTPException(status_code=400, detail="Streaming is not supported in batch requests")
+    
+    results = await asyncio.gather(
+        *(run_completion(item, background_tasks, raw_request) for item in request.requests),
+        return_exceptions=True
+    )
+    
+    responses = []
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("batch_completion_error", error=str(result))
+            responses.append({"error": {"message": str(result), "type": "server_error"}})
+        else:
+            responses.append(result)
+    
+    return OrjsonResponse({"object": "list", "responses": responses})
+
+
+async def prepare_request(
+    request: ChatCompletionRequest,
+    raw_request: Optional[Request] = None
+) -> tuple[str, Optional[List[Dict[str, Any]]], str, str, Dict[str, Any]]:
+    """
+    Extract the last message and load emotional context for a request.
+    
+    The user (and so the per-user thread) comes from the body's `user`
+    field, else from a forwarded user header (see USER_ID_HEADERS).
+    
+    Returns:
+        (message_text, full_message_payload, user_id, thread_id, emotional_context)
+    """
+    
     # Extract user message (last message)
     user_msg = request.messages[-1].content
-    user_id = request.user or "default_user"
+    user_id = resolve_user_id(request, raw_request)
     thread_id = f"thread_{user_id}"
     
-    # Handle multimodal (vision) content
-    full_message_payload = None
-    message_text = ""
-    
-    if isinstance(user_msg, list):
-        # Multimodal message - extract text and keep full payload
-        full_message_payload = user_msg
-        message_text = " ".join([
-            item.get("text", "") 
-            for item in user_msg 
-            if item.get("type") == "text"
-        ])
+    # Handle multimodal (vision) content; very large part lists are parsed
+    # in a worker thread so other streams on this loop aren't stalled
+    if isinstance(user_msg, list) and len(user_msg) >= OFFLOAD_PARTS_THRESHOLD:
+        message_text, full_message_payload = await asyncio.to_thread(
+            extract_message_text, user_msg
+        )
     else:
-        # Text-only message
-        message_text = user_msg
+        message_text, full_message_payload = extract_message_text(user_msg)
     
     logger.info(
         "veda_3.0_request",
@@ -207,28 +428,48 @@ async def chat_completions(
     # VEDA 3.0: Load and prepare emotional state
     emotional_context = await prepare_emotional_context(user_id, message_text)
     
-    if request.stream:
-        return StreamingResponse(
-            stream_generator(
-                message_text,
-                thread_id,
-                full_message_payload,
-                emotional_context,
-                user_id,
-                background_tasks
-            ),
-            media_type="text/event-stream"
+    return message_text, full_message_payload, user_id, thread_id, emotional_context
+
+
+async def run_completion(
+    request: ChatCompletionRequest,
+    background_tasks: BackgroundTasks,
+    raw_request: Optional[Request] = None
+) -> Dict[str, Any]:
+    """
+    Run one non-streaming completion and build its chat.completion body.
+    
+    With `raw_request`, generation runs alongside a disconnect watcher and
+    is cancelled (releasing its admission slot) as soon as the client goes
+    away, even mid LLM call. Nothing (not even the emotion lookup) runs
+    until admission grants a slot, so a batch queues instead of fanning out.
+    """
+    
+    parts: List[str] = []
+    disconnected = False
+    async with admission:
+        message_text, full_message_payload, user_id, thread_id, emotional_context = (
+            await prepare_request(request, raw_request)
         )
-    else:
-        # Non-streaming fallback
-        full_response = ""
-        async for token in veda.process_message_streaming(
-            message_text, 
-            thread_id, 
-            full_message_payload
-        ):
-            full_response += token
         
+        async def generate():
+            async with aclosing(veda.process_message_streaming(
+                message_text, 
+                thread_id, 
+                full_message_payload
+            )) as tokens:
+                async for token in tokens:
+                    parts.append(token)
+        
+        if raw_request is None:
+            await generate()
+        else:
+            disconnected = not await run_until_disconnected(generate(), raw_request)
+    full_response = "".join(parts)
+    
+    if disconnected:
+        logger.info("client_disconnected", user_id=user_id, tokens=len(parts))
+    else:
         # Background: Update emotional state
         background_tasks.add_task(
             update_emotional_state_background,
@@ -237,26 +478,61 @@ async def chat_completions(
             full_response,
             emotional_context
         )
-        
-        return {
-            "id": f"chatcmpl-{int(time.time())}",
-            "object": "chat.completion",
-            "created": int(time.time()),
-            "model": request.model,
-            "choices": [{
-                "index": 0,
-                "message": {
-                    "role": "assistant",
-                    "content": full_response
-                },
-                "finish_reason": "stop"
-            }],
-            "usage": {
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0
-            }
+    
+    created = int(time.time())
+    return {
+        "id": f"chatcmpl-{created}",
+        "object": "chat.completion",
+        "created": created,
+        "model": request.model,
+        "choices": [{
+            "index": 0,
+            "message": {
+                "role": "assistant",
+                "content": full_response
+            },
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0
         }
+    }
+
+
+async def run_until_disconnected(work: Awaitable[Any], raw_request: Request) -> bool:
+    """
+    Await `work` while polling `raw_request` for a client disconnect.
+    
+    Returns True if the work finished. If the client went away first, the
+    work is cancelled (and allowed to clean up) and False is returned.
+    """
+    
+    async def watch():
+        while not await raw_request.is_disconnected():
+            await asyncio.sleep(DISCONNECT_POLL_SECONDS)
+    
+    work_task = asyncio.ensure_future(work)
+    watcher = asyncio.create_task(watch())
+    try:
+        await asyncio.wait((work_task, watcher), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        # No-op once the work has finished; otherwise wait for its cleanup
+        work_task.cancel()
+        await asyncio.wait((work_task,))
+    
+    if work_task.cancelled():
+        return False
+    work_task.result()  # re-raise upstream errors
+    return True
+
+
+# Substring matches (as before), e.g. "errors" and "SAPGUI" count; one
+# case-insensitive pass instead of lower() plus a scan per keyword
+_SAP_KEYWORDS_RE = re.compile(r"sap|basis|transaction|system|error|dump", re.IGNORECASE)
+_URGENT_RE = re.compile(r"urgent|critical|asap", re.IGNORECASE)
 
 
 async def prepare_emotional_context(user_id: str, message: str) -> Dict[str, Any]:
@@ -293,10 +569,7 @@ async def prepare_emotional_context(user_id: str, message: str) -> Dict[str, Any
         
         # Determine mode from message context
         # (Simple heuristic - can be made more sophisticated)
-        has_sap_keywords = any(
-            kw in message.lower() 
-            for kw in ["sap", "basis", "transaction", "system", "error", "dump"]
-        )
+        has_sap_keywords = _SAP_KEYWORDS_RE.search(message) is not None
         state.mode = EmotionMode.WORK if has_sap_keywords else EmotionMode.PERSONAL
         
         # Generate emotion-aware prompt modifier
@@ -325,6 +598,77 @@ async def prepare_emotional_context(user_id: str, message: str) -> Dict[str, Any
         return {}
 
 
+# Closes the frame opened by stream_generator's per-stream `delta_prefix`
+_SSE_DELTA_SUFFIX = b'},"finish_reason":null}]}\n\n'
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# An empty token after a pause longer than this is logged as a stream stall
+STREAM_GAP_WARN_SECONDS = 0.05
+
+# Keep-alive comment interval for idle SSE streams (e.g. during memory lookups)
+SSE_PING_SECONDS = 15
+
+# Non-streaming completions check for a client disconnect this often
+DISCONNECT_POLL_SECONDS = 0.25
+
+# Frames that are already waiting are sent together, up to this many bytes
+SSE_COALESCE_MAX_BYTES = 8192
+
+# Frames the producer may run ahead of the client before it waits
+SSE_BUFFER_FRAMES = 256
+
+
+async def coalesce_frames(
+    frames: AsyncIterator[bytes],
+    max_bytes: int = SSE_COALESCE_MAX_BYTES
+) -> AsyncIterator[bytes]:
+    """
+    Join SSE frames that are ready at the same time into one send.
+    
+    `frames` is consumed by a producer task into a bounded queue. Each send
+    takes the next frame plus whatever else is already queued (up to
+    `max_bytes`), so bursts from a fast model go out in a few ASGI sends
+    while a lone token is still sent immediately (no flush timer).
+    """
+    queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=SSE_BUFFER_FRAMES)
+    failure: Optional[BaseException] = None
+    
+    async def pump():
+        nonlocal failure
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except Exception as e:
+            failure = e
+        await queue.put(None)
+    
+    producer = asyncio.create_task(pump())
+    try:
+        finished = False
+        while not finished:
+            frame = await queue.get()
+            if frame is None:
+                break
+            
+            batch = [frame]
+            size = len(frame)
+            while size < max_bytes and not queue.empty():
+                queued = queue.get_nowait()
+                if queued is None:
+                    finished = True
+                    break
+                batch.append(queued)
+                size += len(queued)
+            
+            yield frame if len(batch) == 1 else b"".join(batch)
+        
+        if failure is not None:
+            raise failure
+    finally:
+        # Client gone or stream done: stop the producer (and upstream)
+        producer.cancel()
+
+
 async def stream_generator(
     message: str,
     thread_id: str,
@@ -332,60 +676,88 @@ async def stream_generator(
     emotional_context: Dict[str, Any],
     user_id: str,
     background_tasks: BackgroundTasks
-):
+) -> AsyncIterator[bytes]:
     """
     Generate Server-Sent Events (SSE) for Open-WebUI with Veda 3.0 cognitive features.
+    
+    Frames are yielded as SSE-encoded bytes (orjson), so the response sends
+    them without another str -> bytes encode or re-framing.
     """
     
-    chunk_id = f"chatcmpl-{int(time.time())}"
-    full_response = ""
+    created = int(time.time())
+    chunk_id = f"chatcmpl-{created}"
+    parts: List[str] = []
+    
+    # Only the token changes between chunks: serialize the envelope once and
+    # splice each JSON-encoded token between a fixed prefix and suffix
+    delta_prefix = (
+        b'data: {"id":"%s","object":"chat.completion.chunk","created":%d,'
+        b'"model":"veda-v3","choices":[{"index":0,"delta":{"content":'
+    ) % (chunk_id.encode(), created)
+    
+    # Finish chunk and [DONE] marker, sent together as one write
+    final_frames = b"data: " + orjson.dumps({
+        "id": chunk_id,
+        "object": "chat.completion.chunk",
+        "created": created,
+        "model": "veda-v3",
+        "choices": [{
+            "index": 0,
+            "delta": {},
+            "finish_reason": "stop"
+        }]
+    }) + b"\n\n" + _SSE_DONE
+    
+    # Empty tokens arriving after a long pause point at artificial pacing
+    # (e.g. a per-token sleep) upstream; warn once per stream
+    gap_warned = False
     
     try:
         # Pass emotional context to orchestrator
         # For now, we'll inject it via veda.persona directly before streaming
         # (In Phase 2, we'll integrate into LangGraph workflow)
         
-        async for token in veda.process_message_streaming(
-            message, 
-            thread_id, 
-            full_message_payload
-        ):
-            full_response += token
-            
-            chunk_data = {
-                "id": chunk_id,
-                "object": "chat.completion.chunk",
-                "created": int(time.time()),
-                "model": "veda-v3",
-                "choices": [{
-                    "index": 0,
-                    "delta": {"content": token},
-                    "finish_reason": None
-                }]
-            }
-            yield f"data: {json.dumps(chunk_data)}\n\n"
+        # Admitted inside the generator, so a stream that never starts holds
+        # no slot
+        async with admission:
+            # Gaps are measured between consecutive tokens only: the wait
+            # for the first one is memory lookups and the LLM call, not pacing
+            last_token_at: Optional[float] = None
+            # Hot loop: log on request boundaries only; the once-per-stream
+            # stall warning is the single exception
+            async for token in veda.process_message_streaming(
+                message, 
+                thread_id, 
+                full_message_payload
+            ):
+                now = time.perf_counter()
+                if (
+                    not token
+                    and not gap_warned
+                    and last_token_at is not None
+                    and now - last_token_at > STREAM_GAP_WARN_SECONDS
+                ):
+                    logger.warning(
+                        "stream_empty_token_gap",
+                        thread_id=thread_id,
+                        gap_ms=round((now - last_token_at) * 1000, 1)
+                    )
+                    gap_warned = True
+                last_token_at = now
+                
+                parts.append(token)
+                
+                yield delta_prefix + orjson.dumps(token) + _SSE_DELTA_SUFFIX
         
         # Send finish signal
-        final_chunk = {
-            "id": chunk_id,
-            "object": "chat.completion.chunk",
-            "created": int(time.time()),
-            "model": "veda-v3",
-            "choices": [{
-                "index": 0,
-                "delta": {},
-                "finish_reason": "stop"
-            }]
-        }
-        yield f"data: {json.dumps(final_chunk)}\n\n"
-        yield "data: [DONE]\n\n"
+        yield final_frames
         
         # VEDA 3.0: Schedule emotional state update in background
         background_tasks.add_task(
             update_emotional_state_background,
             user_id,
             message,
-            full_response,
+            "".join(parts),
             emotional_context
         )
         
@@ -394,7 +766,7 @@ async def stream_generator(
         error_chunk = {
             "id": chunk_id,
             "object": "chat.completion.chunk",
-            "created": int(time.time()),
+            "created": created,
             "model": "veda-v3",
             "choices": [{
                 "index": 0,
@@ -402,8 +774,7 @@ async def stream_generator(
                 "finish_reason": "stop"
             }]
         }
-        yield f"data: {json.dumps(error_chunk)}\n\n"
-        yield "data: [DONE]\n\n"
+        yield b"data: " + orjson.dumps(error_chunk) + b"\n\n" + _SSE_DONE
 
 
 async def update_emotional_state_background(
@@ -422,6 +793,8 @@ async def update_emotional_state_background(
     if not emotion_store or not emotion_manager:
         return
     
+    log = logger.bind(user_id=user_id)
+    
     try:
         state = emotional_context.get("state")
         if not state:
@@ -437,14 +810,13 @@ async def update_emotional_state_background(
             # Modulate intensity based on message characteristics
             if len(message.split()) > 100:
                 intensity *= 1.2  # More intense for longer, detailed messages
-            if any(word in message.lower() for word in ["urgent", "critical", "asap"]):
+            if _URGENT_RE.search(message):
                 intensity *= 1.3  # Higher intensity for urgent matters
             
             state = emotion_manager.apply_trigger(state, trigger, intensity)
             
-            logger.info(
+            log.info(
                 "emotion_triggered",
-                user_id=user_id,
                 trigger=trigger,
                 new_emotion=state.pad_state.to_emotion_label(),
                 intensity=intensity
@@ -454,24 +826,17 @@ async def update_emotional_state_background(
         await emotion_store.save_state(state)
         
     except Exception as e:
-        logger.error("emotion_update_error", user_id=user_id, error=str(e))
+        log.error("emotion_update_error", error=str(e))
 
 
 @app.get("/health")
 async def health_check():
     """Detailed health check with Veda 3.0 status."""
-    emotion_status = "unknown"
-    
-    if emotion_store:
-        try:
-            await emotion_store.connect()
-            emotion_status = "healthy"
-        except:
-            emotion_status = "degraded"
+    emotion_status = await emotion_health() if emotion_store else "unknown"
     
     return {
         "status": "healthy" if veda else "initializing",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": health_timestamp or datetime.now().isoformat(),
         "version": "3.0.0",
         "components": {
             "orchestrator": veda is not None,
@@ -5,12 +5,12 @@ Optimized for $60/month budget with automatic fallback.
 
 import asyncio
 import hashlib
-import json
 from datetime import datetime, date
 from typing import Optional, Literal, AsyncGenerator
 from dataclasses import dataclass, field
 
 import httpx
+import orjson
 from pydantic import BaseModel
 import structlog
 
@@ -22,15 +22,18 @@ class UsageTracker:
     """Track daily token usage and costs per model."""
     daily_costs: dict = field(default_factory=dict)
     current_date: date = field(default_factory=date.today)
+    total_cost: float = 0.0  # Running sum of daily_costs
     
     def reset_if_new_day(self):
         if date.today() != self.current_date:
             self.daily_costs = {}
+            self.total_cost = 0.0
             self.current_date = date.today()
     
     def add_cost(self, model: str, cost: float):
         self.reset_if_new_day()
         self.daily_costs[model] = self.daily_costs.get(model, 0) + cost
+        self.total_cost += cost
     
     def get_daily_cost(self, model: str) -> float:
         self.reset_if_new_day()
@@ -38,7 +41,7 @@ class UsageTracker:
     
     def get_total_daily_cost(self) -> float:
         self.reset_if_new_day()
-        return sum(self.daily_costs.values())
+        return self.total_cost
 
 
 class ModelConfig(BaseModel):
@@ -84,6 +87,31 @@ MODELS = {
 }
 
 
+# Read size for upstream SSE bodies
+STREAM_READ_CHUNK_BYTES = 8192
+
+
+# Task type -> MODELS tier
+TASK_MODEL_TIERS = {
+    "planning": "planning",      # Claude for complex reasoning
+    "coding": "coding",          # DeepSeek for code
+    "chat": "chat",              # Gemini for persona conversations
+    "research": "fallback",      # Kimi for research (save tokens)
+    "dream_state": "fallback",   # Kimi for memory consolidation
+}
+
+
+# Task type -> ordered OpenRouter `models` fallback list (built once)
+FALLBACK_CHAINS: dict[str, tuple[str, ...]] = {
+    "planning": (MODELS["planning"].name, MODELS["fallback"].name),
+    "coding": (MODELS["coding"].name, MODELS["fallback"].name),
+    "chat": (MODELS["chat"].name, MODELS["fallback"].name),
+    "research": (MODELS["fallback"].name, MODELS["chat"].name),
+    "dream_state": (MODELS["fallback"].name,),
+}
+DEFAULT_FALLBACK_CHAIN = (MODELS["chat"].name, MODELS["fallback"].name)
+
+
 class OpenRouterClient:
     """
     Production OpenRouter client with:
@@ -99,11 +127,19 @@ class OpenRouterClient:
         api_key: str,
         base_url: str = "https://openrouter.ai/api/v1",
         daily_budget: float = 2.00,
+        max_connections: int = 200,
+        max_keepalive_connections: int = 100,
     ):
         self.api_key = api_key
         self.base_url = base_url
         self.daily_budget = daily_budget
         self.usage_tracker = UsageTracker()
+        # Below this daily total a tier can't be over its own limit or the
+        # budget warning line, so select_model can skip both checks
+        self._budget_fast_limits = {
+            tier: min(config.daily_limit, daily_budget * 0.9)
+            for tier, config in MODELS.items()
+        }
         self.client = httpx.AsyncClient(
             base_url=base_url,
             headers={
@@ -112,7 +148,17 @@ class OpenRouterClient:
                 "X-Title": "Veda AI Memorial",
                 "Content-Type": "application/json",
             },
-            timeout=120.0,
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            # HTTP/2 multiplexes concurrent streams over one TLS connection
+            # (falls back to HTTP/1.1 if the server doesn't negotiate it)
+            http2=True,
+            # One pooled client per process: keep enough warm connections that
+            # concurrent requests reuse TLS sessions instead of handshaking
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=60.0,
+            ),
         )
     
     def select_model(
@@ -121,18 +167,14 @@ class OpenRouterClient:
     ) -> ModelConfig:
         """Select appropriate model based on task type and budget."""
         
-        # Map task types to model tiers
-        task_model_map = {
-            "planning": "planning",      # Claude for complex reasoning
-            "coding": "coding",          # DeepSeek for code
-            "chat": "chat",              # Gemini for persona conversations
-            "research": "fallback",      # Kimi for research (save tokens)
-            "dream_state": "fallback",   # Kimi for memory consolidation
-        }
-        
-        preferred_tier = task_model_map.get(task_type, "chat")
+        preferred_tier = TASK_MODEL_TIERS.get(task_type, "chat")
         model = MODELS[preferred_tier]
         
+        # Fast path: total spend is under every limit that applies
+        total = self.usage_tracker.get_total_daily_cost()
+        if total < self._budget_fast_limits[preferred_tier]:
+            return model
+        
         # Check if model is within budget
         if self.usage_tracker.get_daily_cost(model.name) >= model.daily_limit:
             logger.warning(
@@ -143,8 +185,8 @@ class OpenRouterClient:
             return MODELS["fallback"]
         
         # Check total daily budget
-        if self.usage_tracker.get_total_daily_cost() >= self.daily_budget * 0.9:
-            logger.warning("daily_budget_warning", total=self.usage_tracker.get_total_daily_cost())
+        if total >= self.daily_budget * 0.9:
+            logger.warning("daily_budget_warning", total=total)
             return MODELS["fallback"]
         
         return model
@@ -198,30 +240,9 @@ class OpenRouterClient:
                 return await self._complete_response(body, MODELS["fallback"])
             raise
     
-    def _get_fallback_chain(self, task_type: str) -> list[str]:
-        """Get ordered fallback chain for task type."""
-        chains = {
-            "planning": [
-                MODELS["planning"].name,
-                MODELS["fallback"].name,
-            ],
-            "coding": [
-                MODELS["coding"].name,
-                MODELS["fallback"].name,
-            ],
-            "chat": [
-                MODELS["chat"].name,
-                MODELS["fallback"].name,
-            ],
-            "research": [
-                MODELS["fallback"].name,
-                MODELS["chat"].name,
-            ],
-            "dream_state": [
-                MODELS["fallback"].name,
-            ],
-        }
-        return chains.get(task_type, [MODELS["chat"].name, MODELS["fallback"].name])
+    def _get_fallback_chain(self, task_type: str) -> tuple[str, ...]:
+        """Get ordered fallback chain for task type (shared, do not mutate)."""
+        return FALLBACK_CHAINS.get(task_type, DEFAULT_FALLBACK_CHAIN)
     
     async def _stream_response(
         self,
@@ -236,24 +257,44 @@ class OpenRouterClient:
         ) as response:
             response.raise_for_status()
             
-            async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    data = line[6:]
-                    if data == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data)
-                        if "choices" in chunk and chunk["choices"]:
-                            delta = chunk["choices"][0].get("delta", {})
-                            content = delta.get("content", "")
-                            if content:
-                                yield content
-                        
-                        # Track usage if present
-                        if "usage" in chunk:
-                            self._track_usage(chunk["usage"], model)
-                    except json.JSONDecodeError:
-                        continue
+            async for data in self._sse_data(response):
+                if data == b"[DONE]":
+                    break
+                try:
+                    chunk = orjson.loads(data)
+                    if "choices" in chunk and chunk["choices"]:
+                        delta = chunk["choices"][0].get("delta", {})
+                        content = delta.get("content", "")
+                        if content:
+                            yield content
+                    
+                    # Track usage if present
+                    if "usage" in chunk:
+                        self._track_usage(chunk["usage"], model)
+                except orjson.JSONDecodeError:
+                    continue
+    
+    @staticmethod
+    async def _sse_data(response: httpx.Response) -> AsyncGenerator[bytes, None]:
+        """
+        Yield the payload of each `data: ` line of an SSE body, as bytes.
+        
+        Lines are split from raw bytes rather than via aiter_lines, so there
+        is no per-line str decode (orjson parses bytes directly).
+        """
+        buffer = bytearray()
+        async for raw in response.aiter_bytes(chunk_size=STREAM_READ_CHUNK_BYTES):
+            buffer += raw
+            start = 0
+            while (end := buffer.find(b"\n", start)) != -1:
+                if buffer[start:start + 6] == b"data: ":
+                    yield bytes(buffer[start + 6:end]).rstrip(b"\r")
+                start = end + 1
+            del buffer[:start]
+        
+        # Last line without a trailing newline
+        if buffer[:6] == b"data: ":
+            yield bytes(buffer[6:]).rstrip(b"\r")
     
     async def _complete_response(self, body: dict, model: ModelConfig) -> dict:
         """Get complete response (non-streaming)."""
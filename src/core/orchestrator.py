@@ -536,7 +536,12 @@ class VedaOrchestrator:
         return None
 
     async def _handle_project_command(self, message: str, user_id: str) -> Optional[str]:
-        """Handle explicit project management commands."""
+        """
+        Handle explicit project management commands.
+
+        Project and graph operations use the synchronous FalkorDB client, so
+        they run via asyncio.to_thread to keep the event loop free.
+        """
         message_lower = message.lower()
 
         await self._ensure_project_services()
@@ -544,7 +549,8 @@ class VedaOrchestrator:
         # Command: List projects
         if re.search(self.project_commands['list'], message_lower):
             try:
-                projects = self.project_service.list_all_projects(
+                projects = await asyncio.to_thread(
+                    self.project_service.list_all_projects,
                     include_archived=False,
                     user_id=user_id
                 )
@@ -571,7 +577,8 @@ class VedaOrchestrator:
         if re.search(self.project_commands['current'], message_lower):
             if self.current_project_id:
                 try:
-                    info = self.project_service.get_project_info(
+                    info = await asyncio.to_thread(
+                        self.project_service.get_project_info,
                         self.current_project_id,
                         include_health=False
                     )
@@ -597,7 +604,8 @@ class VedaOrchestrator:
         if match:
             project_id = match.group(1)
             try:
-                info = self.project_service.get_project_info(
+                info = await asyncio.to_thread(
+                    self.project_service.get_project_info,
                     project_id,
                     include_health=False
                 )
@@ -629,7 +637,8 @@ class VedaOrchestrator:
             
             try:
                 # Create project
-                context = self.memory.project_manager.create_project(
+                context = await asyncio.to_thread(
+                    self.memory.project_manager.create_project,
                     project_id=project_id,
                     metadata={'description': description} if description else None
                 )
@@ -658,7 +667,8 @@ class VedaOrchestrator:
             
             try:
                 # Update metadata
-                self.project_service.update_metadata(
+                await asyncio.to_thread(
+                    self.project_service.update_metadata,
                     project_id=project_id,
                     name=new_name
                 )
@@ -687,7 +697,9 @@ class VedaOrchestrator:
                     logger.debug("unmounted_project_before_delete", project_id=project_id)
                 
                 # Delete
-                self.memory.project_manager.delete_project(project_id, confirm=True)
+                await asyncio.to_thread(
+                    self.memory.project_manager.delete_project, project_id, confirm=True
+                )
                 
                 logger.warning("project_deleted", project_id=project_id, user_id=user_id)
                 return f"✅ Deleted project `{project_id}`. All data has been removed."
@@ -700,7 +712,9 @@ class VedaOrchestrator:
     async def _switch_project(self, project_id: str, user_id: str) -> str:
         """Switch to a different project."""
         try:
-            projects = self.project_service.list_all_projects(user_id=user_id)
+            projects = await asyncio.to_thread(
+                self.project_service.list_all_projects, user_id=user_id
+            )
             project_ids = [p.metadata.project_id for p in projects]
 
             if project_id not in project_ids:
@@ -717,7 +731,7 @@ class VedaOrchestrator:
 
             logger.info("project_switched", project_id=project_id, user_id=user_id)
 
-            info = self.project_service.get_project_info(project_id)
+            info = await asyncio.to_thread(self.project_service.get_project_info, project_id)
 
             response = f"✅ Switched to **{info.metadata.name}** (`{project_id}`)\n\n"
             response += f"Systems: {info.statistics.get('total_systems', 0)} | "
@@ -946,16 +960,17 @@ class VedaOrchestrator:
             has_project=bool(self.current_project_id)
         )
 
-        response_chunks = []
-        async for chunk in await self.client.chat(
+        # The reply is yielded as one piece (after post-processing), so ask
+        # OpenRouter for it in one piece too: a single JSON body instead of
+        # an SSE chunk (and decode) per token
+        completion = await self.client.chat(
             messages=messages,
             task_type=task_type,
-            stream=True,
+            stream=False,
             temperature=0.7
-        ):
-            response_chunks.append(chunk)
-
-        full_response = "".join(response_chunks)
+        )
+        choices = completion.get("choices") or [{}]
+        full_response = choices[0].get("message", {}).get("content") or ""
         final_response = full_response
 
         # 9. CURIOSITY (skipping for brevity - same as before)
@@ -0,0 +1,64 @@
+"""
+Tests for API admission control (bounded in-flight completions).
+
+Run with:
+    cd ~/veda
+    uv run pytest tests/test_admission.py
+"""
+
+import asyncio
+
+from src.core.admission import AdmissionControl
+
+
+async def test_waiters_are_admitted_in_fifo_order():
+    """Freed slots go to waiters in arrival order."""
+    admission = AdmissionControl(1)
+    order = []
+
+    async def worker(name):
+        async with admission:
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(worker(i) for i in range(4)))
+
+    assert order == [0, 1, 2, 3]
+    assert admission.in_flight == 0
+
+
+async def test_cancelled_waiter_then_release():
+    """A waiter cancelled before release neither leaks a slot nor raises ValueError."""
+    admission = AdmissionControl(1)
+    await admission.__aenter__()
+
+    waiting = asyncio.create_task(admission.__aenter__())
+    await asyncio.sleep(0)
+    waiting.cancel()
+
+    # Release before the cancelled task resumes: _wake drops its waiter
+    await admission.__aexit__(None, None, None)
+
+    try:
+        await waiting
+    except asyncio.CancelledError:
+        pass
+    else:
+        raise AssertionError("waiter should have been cancelled")
+
+    assert admission.in_flight == 0
+    async with admission:
+        assert admission.in_flight == 1
+
+
+async def test_raising_limit_admits_waiters():
+    """Raising the limit admits queued waiters immediately."""
+    admission = AdmissionControl(0)
+    waiting = asyncio.create_task(admission.__aenter__())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    admission.limit = 1
+    await waiting
+
+    assert admission.in_flight == 1
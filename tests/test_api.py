@@ -0,0 +1,208 @@
+"""
+Tests for the API server's completion endpoints.
+
+Needs the full server dependencies (LangGraph etc.); skipped without them.
+
+Run with:
+    cd ~/veda
+    uv run pytest tests/test_api.py
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from fastapi import BackgroundTasks  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from src.core import api  # noqa: E402
+from src.core.admission import AdmissionControl  # noqa: E402
+
+
+class FakeVeda:
+    """Orchestrator stand-in that records admission while generating."""
+
+    def __init__(self, admission):
+        self.admission = admission
+        self.peak_in_flight = 0
+
+    async def process_message_streaming(self, message, thread_id, payload=None):
+        self.peak_in_flight = max(self.peak_in_flight, self.admission.in_flight)
+        yield f"echo:{message}"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    admission = AdmissionControl(1)
+    monkeypatch.setattr(api, "admission", admission)
+    monkeypatch.setattr(api, "veda", FakeVeda(admission))
+    monkeypatch.setattr(api, "emotion_store", None)
+
+    prepared_in_flight = []
+    original_prepare = api.prepare_request
+
+    async def recording_prepare(request, raw_request=None):
+        prepared_in_flight.append(admission.in_flight)
+        return await original_prepare(request, raw_request)
+
+    monkeypatch.setattr(api, "prepare_request", recording_prepare)
+
+    test_client = TestClient(api.app)  # no lifespan: nothing external starts
+    test_client.prepared_in_flight = prepared_in_flight
+    return test_client
+
+
+def _batch(count, **extra):
+    return {
+        "requests": [
+            {"messages": [{"role": "user", "content": f"q{i}"}], **extra}
+            for i in range(count)
+        ]
+    }
+
+
+def test_batch_returns_one_completion_per_request(client):
+    response = client.post("/v1/chat/completions/batch", json=_batch(3))
+
+    assert response.status_code == 200
+    body = response.json()
+    contents = [r["choices"][0]["message"]["content"] for r in body["responses"]]
+    assert contents == ["echo:q0", "echo:q1", "echo:q2"]
+
+
+def test_batch_items_prepare_only_after_admission(client):
+    client.post("/v1/chat/completions/batch", json=_batch(4))
+
+    # Every item held a slot while preparing, and the limit (1) was respected
+    assert client.prepared_in_flight == [1, 1, 1, 1]
+    assert api.veda.peak_in_flight == 1
+    assert api.admission.in_flight == 0
+
+
+def test_batch_over_limit_is_rejected(client):
+    response = client.post(
+        "/v1/chat/completions/batch", json=_batch(api.MAX_BATCH_REQUESTS + 1)
+    )
+
+    assert response.status_code == 413
+    assert client.prepared_in_flight == []
+
+
+def test_batch_rejects_streaming_items(client):
+    response = client.post("/v1/chat/completions/batch", json=_batch(1, stream=True))
+
+    assert response.status_code == 400
+
+
+class SlowVeda:
+    """Orchestrator stand-in whose reply takes far longer than the test."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def process_message_streaming(self, message, thread_id, payload=None):
+        self.started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        yield "too late"
+
+
+class DisconnectingRequest:
+    """Request stand-in that reports a disconnect once `gone` is set."""
+
+    headers = {}
+
+    def __init__(self):
+        self.gone = asyncio.Event()
+
+    async def is_disconnected(self):
+        return self.gone.is_set()
+
+
+async def test_disconnect_cancels_slow_upstream_and_releases_admission(monkeypatch):
+    admission = AdmissionControl(1)
+    veda = SlowVeda()
+    monkeypatch.setattr(api, "admission", admission)
+    monkeypatch.setattr(api, "veda", veda)
+    monkeypatch.setattr(api, "emotion_store", None)
+    monkeypatch.setattr(api, "DISCONNECT_POLL_SECONDS", 0.01)
+
+    raw_request = DisconnectingRequest()
+    background_tasks = BackgroundTasks()
+    request = api.ChatCompletionRequest(messages=[{"role": "user", "content": "hi"}])
+    completion = asyncio.create_task(
+        api.run_completion(request, background_tasks, raw_request)
+    )
+
+    await veda.started.wait()
+    raw_request.gone.set()
+    body = await asyncio.wait_for(completion, timeout=1)
+
+    assert veda.cancelled
+    assert admission.in_flight == 0
+    assert body["choices"][0]["message"]["content"] == ""
+    # No emotion update for a reply nobody received
+    assert background_tasks.tasks == []
+
+
+class ScriptedVeda:
+    """Orchestrator stand-in that yields `(delay, token)` steps in order."""
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    async def process_message_streaming(self, message, thread_id, payload=None):
+        for delay, token in self.steps:
+            await asyncio.sleep(delay)
+            yield token
+
+
+class RecordingLogger:
+    """Logger stand-in that keeps warning event names."""
+
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, event, **fields):
+        self.warnings.append(event)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+async def _stream_warnings(monkeypatch, steps):
+    monkeypatch.setattr(api, "admission", AdmissionControl(1))
+    monkeypatch.setattr(api, "veda", ScriptedVeda(steps))
+    monkeypatch.setattr(api, "STREAM_GAP_WARN_SECONDS", 0.01)
+    recorder = RecordingLogger()
+    monkeypatch.setattr(api, "logger", recorder)
+
+    frames = [
+        frame
+        async for frame in api.stream_generator(
+            "hi", "thread_test", None, {}, "test_user", BackgroundTasks()
+        )
+    ]
+    assert frames[-1].endswith(b"data: [DONE]\n\n")
+    return recorder.warnings
+
+
+async def test_empty_first_token_after_slow_upstream_does_not_warn(monkeypatch):
+    # The orchestrator can return empty content after its memory and LLM work
+    warnings = await _stream_warnings(monkeypatch, [(0.05, "")])
+
+    assert warnings == []
+
+
+async def test_empty_token_after_gap_between_tokens_warns_once(monkeypatch):
+    warnings = await _stream_warnings(
+        monkeypatch, [(0, "a"), (0.05, ""), (0.05, ""), (0, "b")]
+    )
+
+    assert warnings == ["stream_empty_token_gap"]
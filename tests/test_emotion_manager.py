@@ -0,0 +1,220 @@
+"""
+Test suite for Veda 3.0 Emotion Manager
+Tests PAD state transitions, decay and serialization (no Redis required).
+
+Run with:
+    cd ~/veda
+    uv run pytest tests/test_emotion_manager.py
+"""
+
+import time
+from datetime import datetime
+
+from src.cognition import emotion_manager
+from src.cognition.emotion_manager import (
+    EmotionManager,
+    EmotionMode,
+    EmotionPromptGenerator,
+    PADState,
+    RedisEmotionStore,
+    VedaEmotionalState,
+)
+
+
+def test_decay_uses_epoch_timestamp():
+    """Decay moves state toward baseline based on `last_update_ts`."""
+    manager = EmotionManager()
+    state = VedaEmotionalState(
+        user_id="test_user",
+        pad_state=PADState(pleasure=1.0, arousal=1.0, dominance=1.0),
+        last_update_ts=time.time() - 30 * 60,  # one pleasure half-life ago
+    )
+
+    state = manager.apply_decay(state)
+
+    # pleasure: 0.2 + (1.0 - 0.2) * 0.5 = 0.6
+    assert abs(state.pad_state.pleasure - 0.6) < 0.01
+    assert state.pad_state.arousal < 1.0
+    assert state.pad_state.dominance < 1.0
+
+
+def test_trigger_updates_timestamp():
+    """Applying a trigger refreshes the timestamp and records the event."""
+    manager = EmotionManager()
+    state = VedaEmotionalState(user_id="test_user", last_update_ts=0.0)
+
+    state = manager.apply_trigger(state, "user_praise")
+
+    assert time.time() - state.last_update_ts < 5
+    assert state.trigger_event == "user_praise"
+    assert isinstance(state.last_update, datetime)
+
+
+def test_work_mode_dampens_trigger():
+    """Work mode mutes pleasure and boosts dominance."""
+    manager = EmotionManager()
+    state = VedaEmotionalState(user_id="test_user", mode=EmotionMode.WORK)
+
+    state = manager.apply_trigger(state, "successful_fix")
+
+    assert abs(state.pad_state.pleasure - 0.15) < 1e-9
+    assert abs(state.pad_state.arousal - 0.15) < 1e-9
+    assert abs(state.pad_state.dominance - 0.36) < 1e-9
+
+
+def test_unknown_trigger_is_ignored():
+    manager = EmotionManager()
+    state = VedaEmotionalState(user_id="test_user")
+
+    state = manager.apply_trigger(state, "not_a_trigger")
+
+    assert state.pad_state == PADState()
+    assert state.trigger_event is None
+
+
+def test_json_round_trip():
+    state = VedaEmotionalState(
+        user_id="test_user",
+        pad_state=PADState(pleasure=0.5, arousal=-0.25, dominance=0.1),
+        trigger_event="task_success",
+    )
+
+    restored = VedaEmotionalState.model_validate_json(state.model_dump_json())
+
+    assert restored.last_update_ts == state.last_update_ts
+    assert restored.pad_state == state.pad_state
+    assert restored.trigger_event == "task_success"
+
+
+def test_legacy_iso_last_update_is_migrated():
+    """States saved with an ISO `last_update` string still load."""
+    legacy = (
+        '{"user_id": "test_user", "session_id": "default", '
+        '"pad_state": {"pleasure": 0.1, "arousal": 0.2, "dominance": 0.3}, '
+        '"mode": "personal", "last_update": "2026-01-01T12:00:00", "trigger_event": null}'
+    )
+
+    state = VedaEmotionalState.model_validate_json(legacy)
+
+    assert state.last_update == datetime(2026, 1, 1, 12, 0, 0)
+    assert state.pad_state.arousal == 0.2
+
+
+def test_personal_modifier_intensity_suffix():
+    generator = EmotionPromptGenerator()
+    strong = VedaEmotionalState(
+        user_id="test_user",
+        pad_state=PADState(pleasure=0.8, arousal=0.8, dominance=0.5),
+    )
+    subtle = VedaEmotionalState(user_id="test_user")
+
+    assert generator.generate_modifier(strong).endswith("intensity is high (1.24).")
+    assert generator.generate_modifier(subtle).endswith("intensity is low (0.00).")
+
+
+def test_work_modifier_has_no_intensity_suffix():
+    generator = EmotionPromptGenerator()
+    state = VedaEmotionalState(
+        user_id="test_user",
+        mode=EmotionMode.WORK,
+        pad_state=PADState(pleasure=0.8, arousal=0.8, dominance=0.5),
+    )
+
+    modifier = generator.generate_modifier(state)
+
+    assert modifier.startswith("You're confident and highly engaged")
+    assert "intensity" not in modifier
+
+
+def test_detect_trigger_from_message():
+    manager = EmotionManager()
+
+    assert manager.detect_trigger_from_message("Ugh, this is SO annoying", "") == "user_frustration"
+    assert manager.detect_trigger_from_message("Got an ST22 dump", "") == "dump_analysis"
+    assert manager.detect_trigger_from_message("Is it ok now?", "Yes, it's resolved") == "successful_fix"
+    assert manager.detect_trigger_from_message("Thanks!", "") == "user_praise"
+
+
+def test_detect_trigger_is_memoized_and_bounded(monkeypatch):
+    manager = EmotionManager()
+    calls = []
+    detect = emotion_manager._detect_trigger
+
+    def counting_detect(*args):
+        calls.append(args)
+        return detect(*args)
+
+    monkeypatch.setattr(emotion_manager, "_detect_trigger", counting_detect)
+    monkeypatch.setattr(emotion_manager, "_TRIGGER_CACHE", type(emotion_manager._TRIGGER_CACHE)())
+    monkeypatch.setattr(emotion_manager, "TRIGGER_CACHE_SIZE", 2)
+
+    assert manager.detect_trigger_from_message("Thanks!", "") == "user_praise"
+    assert manager.detect_trigger_from_message("THANKS!", "") == "user_praise"
+    assert len(calls) == 1  # same lowercased message: served from the cache
+
+    manager.detect_trigger_from_message("Got an ST22 dump", "")
+    manager.detect_trigger_from_message("Is it ok now?", "Yes, it's resolved")
+    assert len(emotion_manager._TRIGGER_CACHE) == 2
+    # Keys are fixed-size digests, not the conversation text
+    assert all(len(key) == 16 for key in emotion_manager._TRIGGER_CACHE)
+
+
+def test_redis_hash_quantizes_pad():
+    """PAD is stored as int8 steps; round trip error stays below 1e-2."""
+    state = VedaEmotionalState(
+        user_id="test_user",
+        pad_state=PADState(pleasure=0.123456, arousal=-0.987654, dominance=1.0),
+        trigger_event="task_success",
+    )
+
+    mapping, stale = RedisEmotionStore._to_hash(state)
+    fields = {k: str(v) for k, v in mapping.items()}  # Redis returns strings
+    restored = RedisEmotionStore._from_hash("test_user", fields)
+
+    assert (mapping["p"], mapping["a"], mapping["d"]) == (16, -125, 127)
+    for axis in ("pleasure", "arousal", "dominance"):
+        error = abs(getattr(restored.pad_state, axis) - getattr(state.pad_state, axis))
+        assert error < 1e-2
+    assert restored.last_update_ts == state.last_update_ts
+    assert restored.trigger_event == "task_success"
+    assert restored.mode == EmotionMode.PERSONAL
+
+
+def test_redis_deserialize_legacy_float_pad():
+    legacy = VedaEmotionalState(
+        user_id="test_user",
+        pad_state=PADState(pleasure=0.5, arousal=0.25, dominance=-0.5),
+    ).model_dump_json()
+
+    restored = RedisEmotionStore._deserialize(legacy)
+
+    assert restored.pad_state == PADState(pleasure=0.5, arousal=0.25, dominance=-0.5)
+
+
+def test_default_decay_configs_are_shared():
+    """Default configs are frozen singletons and skipped in storage."""
+    first = VedaEmotionalState(user_id="a")
+    second = VedaEmotionalState(user_id="b")
+
+    assert first.personal_config is second.personal_config
+    assert first.work_config is second.work_config
+
+    mapping, stale = RedisEmotionStore._to_hash(first)
+    restored = RedisEmotionStore._from_hash("a", {k: str(v) for k, v in mapping.items()})
+
+    assert "pc" not in mapping and "wc" not in mapping
+    assert stale == ("pc", "wc")
+    assert restored.personal_config is first.personal_config
+
+
+async def test_store_refuses_calls_after_close():
+    """A closed store rejects calls instead of reconnecting and restarting its writer."""
+    store = RedisEmotionStore()
+    await store.close()
+
+    assert await store.save_state(VedaEmotionalState(user_id="test_user")) is False
+    assert await store.get_state("test_user") is None
+    assert await store.delete_state("test_user") is False
+    assert store.redis is None
+    assert store._writer_task is None
+    assert store._write_q.empty()
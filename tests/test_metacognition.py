@@ -0,0 +1,186 @@
+"""
+Test suite for Veda 3.0 Metacognition
+Tests fast-path safety rules and the pre-response analysis pipeline.
+
+Run with:
+    cd ~/veda
+    uv run pytest tests/test_metacognition.py
+"""
+
+import logging
+
+import structlog
+
+from src.cognition.metacognition import (
+    ANALYSIS_KEYWORDS,
+    AnalysisCache,
+    FastPathChecker,
+    KeywordScanner,
+    MetacognitiveAnalyzer,
+    SafetyLevel,
+    WHOLE_WORD_CATEGORIES,
+    analyze_before_response,
+)
+
+
+def test_fast_path_greetings_are_safe():
+    checker = FastPathChecker()
+
+    for message in ["Hi Veda!", "Hello there", "Thank you so much", "What's up?"]:
+        result = checker.check_safety(message)
+        assert result is not None and result.is_safe and result.fast_path, message
+
+
+def test_fast_path_sap_vocabulary_is_safe():
+    checker = FastPathChecker()
+
+    assert checker.check_safety("please look at SM50 work processes and tell me").is_safe
+    assert checker.check_safety("can you explain the ST22 output for the dumps today").is_safe
+
+
+def test_fast_path_high_risk_is_blocked():
+    checker = FastPathChecker()
+
+    result = checker.check_safety("tell me the best way to drop table on production now")
+
+    assert result is not None
+    assert not result.is_safe
+    assert result.risk_level == SafetyLevel.HIGH_RISK
+    assert result.concerns == ["Detected high-risk pattern: drop table"]
+
+
+def test_fast_path_elevated_risk_defers_to_llm():
+    checker = FastPathChecker()
+
+    assert checker.check_safety("I forgot my password again") is None
+
+
+def test_fast_path_short_messages_are_safe():
+    checker = FastPathChecker()
+
+    assert checker.check_safety("ok sounds good").is_safe
+    assert checker.check_safety("please restart the remote app server right away") is None
+
+
+def test_keyword_scanner_reports_all_categories():
+    scanner = KeywordScanner(ANALYSIS_KEYWORDS)
+
+    hits = scanner.scan("can you explain this error? i'm stressed")
+
+    assert hits["intent_help"] == {"can you"}
+    assert hits["intent_info"] == {"explain"}
+    assert hits["intent_troubleshooting"] == {"error"}
+    assert hits["emotion"] == {"stressed"}
+    assert "this" in hits["vague"]
+    assert hits["unsafe"] == set()
+
+
+def test_keyword_scanner_whole_word_categories():
+    """Intent/vague keywords no longer fire inside other words."""
+    scanner = KeywordScanner(ANALYSIS_KEYWORDS, WHOLE_WORD_CATEGORIES)
+
+    hits = scanner.scan("which commit broke the hacking detector?")
+
+    assert hits["intent_greeting"] == set()   # "hi" in "which"
+    assert hits["vague"] == set()             # "it" in "commit"
+    assert hits["unsafe"] == {"hack"}         # substring match kept
+    assert scanner.scan("hi, is it down?")["intent_greeting"] == {"hi"}
+
+
+def test_keyword_scanner_overlapping_and_prefix_matches():
+    scanner = KeywordScanner({"a": ("hi", "his"), "b": ("history",)})
+
+    hits = scanner.scan("history")
+
+    assert hits == {"a": {"hi", "his"}, "b": {"history"}}
+
+
+async def test_analyze_classifies_troubleshooting():
+    analyzer = MetacognitiveAnalyzer()
+
+    result = await analyzer.analyze(
+        "I'm stressed, the SAP job is broken and keeps failing every night since Monday",
+        mode="work",
+    )
+
+    assert result.safety.is_safe
+    assert result.intent.primary_intent == "troubleshooting"
+    assert result.tone.empathy_required == "high"
+    assert result.tone.formality_level == 4
+
+
+async def test_analyze_ignores_greeting_inside_words():
+    analyzer = MetacognitiveAnalyzer()
+
+    result = await analyzer.analyze("which one shall we pick for the weekend", mode="personal")
+
+    assert result.intent.primary_intent == "general_conversation"
+
+
+async def test_analyze_before_response_caches_context_free_calls():
+    first = await analyze_before_response("Can you help me with STMS?", mode="work")
+    second = await analyze_before_response("can you help me with stms?", mode="work")
+    other_mode = await analyze_before_response("can you help me with stms?", mode="personal")
+    with_history = await analyze_before_response(
+        "can you help me with stms?",
+        conversation_history=[{"role": "user", "content": "hi"}],
+        mode="work",
+    )
+
+    assert second["result"] == first["result"].model_copy(
+        update={
+            "processing_time_ms": second["result"].processing_time_ms,
+            "timestamp": second["result"].timestamp,
+        }
+    )
+    assert second["guidance"] == first["guidance"]
+    assert other_mode["result"] is not first["result"]
+    assert with_history["result"] is not first["result"]
+
+
+async def test_analyze_before_response_cache_hits_are_private_copies():
+    first = await analyze_before_response("what's the weather like?", mode="work")
+    first["result"].internal_reasoning.append("mutated by caller")
+    second = await analyze_before_response("What's the weather like?", mode="work")
+    third = await analyze_before_response("what's the weather like?", mode="work")
+
+    assert second["result"] is not first["result"]
+    assert third["result"] is not second["result"]
+    assert "mutated by caller" not in third["result"].internal_reasoning
+    assert second["result"].timestamp >= first["result"].timestamp
+    assert second["processing_time_ms"] == second["result"].processing_time_ms
+
+
+def test_analysis_cache_evicts_and_expires():
+    cache = AnalysisCache(maxsize=2, ttl=60)
+    keys = [AnalysisCache.make_key(f"msg {i}", "personal", False) for i in range(3)]
+
+    cache.set(keys[0], "a")
+    cache.set(keys[1], "b")
+    cache.get(keys[0])          # refresh: keys[1] is now least recently used
+    cache.set(keys[2], "c")
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == "a"
+
+    expired = AnalysisCache(ttl=-1)
+    expired.set(keys[0], "a")
+    assert expired.get(keys[0]) is None
+    assert len(expired) == 0
+
+
+async def test_reasoning_only_collected_when_debug_enabled():
+    analyzer = MetacognitiveAnalyzer()
+
+    saved_config = structlog.get_config()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG))
+    try:
+        verbose = await analyzer.analyze("hi there")
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+        quiet = await analyzer.analyze("hi there")
+    finally:
+        structlog.configure(**saved_config)
+
+    assert verbose.internal_reasoning[0] == "[SAFETY] Fast path: safe"
+    assert quiet.internal_reasoning == []
+    assert quiet.intent == verbose.intent
@@ -0,0 +1,40 @@
+"""
+Tests for the OpenRouter client's SSE line splitting (no network).
+
+Run with:
+    cd ~/veda
+    uv run pytest tests/test_openrouter_client.py
+"""
+
+from src.core.openrouter_client import OpenRouterClient
+
+
+class ChunkedResponse:
+    """Response stand-in that delivers the body in the given byte chunks."""
+
+    def __init__(self, *chunks):
+        self.chunks = chunks
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self.chunks:
+            yield chunk
+
+
+async def _data(*chunks):
+    return [data async for data in OpenRouterClient._sse_data(ChunkedResponse(*chunks))]
+
+
+async def test_sse_data_joins_lines_split_across_chunks():
+    chunks = (b'data: {"a"', b': 1}\n\nda', b"ta: [DO", b"NE]\n")
+
+    assert await _data(*chunks) == [b'{"a": 1}', b"[DONE]"]
+
+
+async def test_sse_data_yields_trailing_line_without_newline():
+    assert await _data(b"data: first\n", b"data: last") == [b"first", b"last"]
+
+
+async def test_sse_data_strips_crlf_and_skips_other_fields():
+    chunks = (b": keep-alive\r\n", b"event: message\r\ndata: x\r", b"\n\r\ndata: y\r\n")
+
+    assert await _data(*chunks) == [b"x", b"y"]
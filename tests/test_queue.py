@@ -2,7 +2,11 @@
 Test question queue with Redis integration
 """
 import asyncio
-from src.cognition.question_queue import QuestionQueue
+
+import pytest
+
+from src.cognition.question_queue import PendingQuestion, QuestionQueue
+
 
 async def test():
     # Initialize queue (uses Phase 1 Redis on port 6380)
@@ -126,5 +130,52 @@ async def test():
     print("\n" + "=" * 70)
     print("Test suite complete!")
 
+
+def test_serialize_compresses_large_context():
+    """Large contexts are stored compressed; small ones stay plain JSON."""
+    big = PendingQuestion(
+        question_id="q_1", question_text="Which system?", conversation_id="conv",
+        user_id="u", priority=0.5, created_at="2026-01-01T00:00:00",
+        context={"snippets": ["ST22 dump " * 50] * 10, "empty": []},
+    )
+    small = PendingQuestion(
+        question_id="q_2", question_text="Which system?", conversation_id="conv",
+        user_id="u", priority=0.5, created_at="2026-01-01T00:00:00",
+        context={"uncertainty": 0.6},
+    )
+
+    big_raw = QuestionQueue._serialize(big)
+    small_raw = QuestionQueue._serialize(small)
+
+    assert b'"context_z"' in big_raw and len(big_raw) < 1000
+    assert b'"context_z"' not in small_raw
+    assert QuestionQueue._deserialize(big_raw) == big
+    assert QuestionQueue._deserialize(small_raw) == small
+
+
+async def test_compaction_sweep_runs_once_per_interval():
+    """One queue sweeps stale entries; other instances skip until the interval ends."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis needs it for the Lua scripts
+
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    queues = [QuestionQueue(redis_client=client) for _ in range(2)]
+    for queue in queues:
+        await queue.initialize()
+
+    try:
+        question_id = await queues[0].add_question("Which system?", "conv", priority=0.5)
+        queue_key = queues[0]._get_queue_key("conv")
+        # Queue entry whose question data is gone (e.g. a partial cleanup)
+        await client.zadd(queue_key, {"q_conv_stale": 0.9})
+
+        assert await queues[0].compact_all_if_due() == 1
+        assert await queues[1].compact_all_if_due() is None
+        assert await client.zrange(queue_key, 0, -1) == [question_id]
+    finally:
+        for queue in queues:
+            await queue.close()
+
+
 if __name__ == "__main__":
     asyncio.run(test())
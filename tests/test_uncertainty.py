@@ -1,7 +1,9 @@
 """
 Test uncertainty scoring with various query types
 """
-from src.cognition.uncertainty_scorer import check_uncertainty
+import pytest
+
+from src.cognition.uncertainty_scorer import UncertaintyScorer, check_uncertainty
 
 # Test cases
 test_cases = [
@@ -63,5 +65,30 @@ for i, test in enumerate(test_cases, 1):
     if result.suggested_question:
         print(f"Suggested: {result.suggested_question}")
 
+
+def test_batch_matches_single_scoring():
+    """Batch scoring returns exactly what per-item scoring does."""
+    scorer = UncertaintyScorer(uncertainty_threshold=0.45)
+    batch = scorer.score_uncertainty_batch(
+        [test["query"] for test in test_cases],
+        [test["response"] for test in test_cases],
+        [0] * len(test_cases)
+    )
+
+    assert len(batch) == len(test_cases)
+    for single, test in zip(batch, test_cases, strict=True):
+        assert single == scorer.score_uncertainty(test["query"], test["response"], 0)
+
+
+def test_batch_rejects_mismatched_lengths():
+    """Misaligned batch inputs raise instead of being truncated."""
+    scorer = UncertaintyScorer()
+
+    with pytest.raises(ValueError):
+        scorer.score_uncertainty_batch(["a", "b"], ["x"])
+    with pytest.raises(ValueError):
+        scorer.score_uncertainty_batch(["a"], ["x"], [0, 1])
+
+
 print("\n" + "=" * 60)
 print("Test suite complete!")